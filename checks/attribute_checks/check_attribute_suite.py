@@ -6,6 +6,113 @@ from compliance_checker.base import BaseCheck, Result, TestCtx
 import numpy as np
 from esgvoc import api as voc
 import re
+from functools import lru_cache
+
+
+# Vocabulary lookups open a database session each time, while the same
+# (project, collection, value) combinations recur for every checked file.
+# Results are cached per process; failed lookups raise and are not cached.
+@lru_cache(maxsize=1024)
+def _get_term(project_name, cv_collection, cv_collection_key):
+    return voc.get_term_in_collection(
+        project_id=project_name,
+        collection_id=cv_collection,
+        term_id=cv_collection_key,
+    )
+
+
+@lru_cache(maxsize=4096)
+def _valid_term_cached(value, project_name, cv_collection):
+    return bool(
+        voc.valid_term_in_collection(
+            value=value, project_id=project_name, collection_id=cv_collection
+        )
+    )
+
+
+def _is_valid_term(value, project_name, cv_collection):
+    if isinstance(value, str):
+        return _valid_term_cached(value, project_name, cv_collection)
+    # Non-string attribute values (e.g. numpy arrays) may not be hashable
+    return bool(
+        voc.valid_term_in_collection(
+            value=value, project_id=project_name, collection_id=cv_collection
+        )
+    )
+
+
+def _attr_key_index(ds, var_name=None):
+    """Map lower-cased attribute names to their first NetCDF spelling."""
+    if var_name:
+        nc_attrs = ds.variables[var_name].ncattrs() if var_name in ds.variables else []
+    else:
+        nc_attrs = ds.ncattrs()
+
+    index = {}
+    for a in nc_attrs:
+        index.setdefault(a.lower(), a)
+    return index
+
+
+def _attribute_label(code, desc, attribute_name, var_name=None):
+    prefix = f"[{code}]"
+    if var_name:
+        return f"{prefix} {var_name} | {desc}: Variable Attribute '{attribute_name}'"
+    return f"{prefix} {desc}: Global Attribute '{attribute_name}'"
+
+
+def _missing_attribute_results(attribute_name, severity, is_required, var_name, nc_key):
+    """ATTR001 results for an attribute absent from the file or variable."""
+    if not is_required:
+        return []
+    existence_ctx = TestCtx(
+        severity, _attribute_label("ATTR001", "Existence", attribute_name, var_name)
+    )
+    existence_ctx.add_failure(
+        f"Required attribute '{attribute_name}' (NetCDF key '{nc_key}') is missing."
+    )
+    return [existence_ctx.to_result()]
+
+
+def check_attribute_suite_batch(ds, rules, project_name=None):
+    """
+    Run check_attribute_suite for a sequence of rules.
+
+    Each rule is a mapping of check_attribute_suite keyword arguments. The
+    attribute names of the file and of each variable are scanned once for the
+    whole batch instead of once per rule.
+    """
+    indexes = {}
+    results = []
+    for rule in rules:
+        nc_key = rule.get("attribute_nc_name")
+        if not nc_key:
+            var_name = rule.get("var_name")
+            index = indexes.get(var_name)
+            if index is None:
+                index = indexes[var_name] = _attr_key_index(ds, var_name)
+            attribute_name = rule["attribute_name"]
+            nc_key = index.get(attribute_name.lower())
+            if nc_key is None and (not var_name or var_name in ds.variables):
+                # Absent attribute: only the ATTR001 outcome applies
+                results.extend(
+                    _missing_attribute_results(
+                        attribute_name,
+                        rule["severity"],
+                        rule.get("is_required", True),
+                        var_name,
+                        attribute_name,
+                    )
+                )
+                continue
+        results.extend(
+            check_attribute_suite(
+                ds=ds,
+                project_name=project_name,
+                **{**rule, "attribute_nc_name": nc_key},
+            )
+        )
+    return results
 
 
 def check_attribute_suite(
@@ -29,26 +136,16 @@ def check_attribute_suite(
     ATTR003 — UTF-8 Encoding
     ATTR004 — Value validation (Regex or ESGVOC)
     """
-    if var_name:
-        nc_attrs = ds.variables[var_name].ncattrs() if var_name in ds.variables else []
-    else:
-        nc_attrs = ds.ncattrs()
-
     if attribute_nc_name:
         nc_key = attribute_nc_name
     else:
-        matches = [a for a in nc_attrs if a.lower() == attribute_name.lower()]
-        nc_key = matches[0] if matches else attribute_name
+        nc_key = _attr_key_index(ds, var_name).get(
+            attribute_name.lower(), attribute_name
+        )
 
     # Label builder
     def label(code, desc):
-        prefix = f"[{code}]"
-        if var_name:
-            return (
-                f"{prefix} {var_name} | {desc}: Variable Attribute '{attribute_name}'"
-            )
-        else:
-            return f"{prefix} {desc}: Global Attribute '{attribute_name}'"
+        return _attribute_label(code, desc, attribute_name, var_name)
 
     results = []
     attr_value = None
@@ -74,13 +171,9 @@ def check_attribute_suite(
         results.append(existence_ctx.to_result())
 
     except AttributeError:
-        if is_required:
-            existence_ctx.add_failure(
-                f"Required attribute '{attribute_name}' (NetCDF key '{nc_key}') is missing."
-            )
-            results.append(existence_ctx.to_result())
-
-        return results
+        return _missing_attribute_results(
+            attribute_name, severity, is_required, var_name, nc_key
+        )
 
     if attr_value is None:
         return results
@@ -136,15 +229,17 @@ def check_attribute_suite(
     # ---------- CASE A: REGEX ----------
     if constraint is not None:
         pattern_ctx = TestCtx(severity, label("ATTR004", "Regex Match Check"))
+        # constraint is either a regex string or an already compiled pattern
+        pattern_str = getattr(constraint, "pattern", constraint)
         try:
             if re.fullmatch(constraint, str(attr_value)):
                 pattern_ctx.add_pass()
             else:
                 pattern_ctx.add_failure(
-                    f"Value '{attr_value}' does not match regex '{constraint}'."
+                    f"Value '{attr_value}' does not match regex '{pattern_str}'."
                 )
         except re.error:
-            pattern_ctx.add_failure(f"Invalid regex expression '{constraint}'.")
+            pattern_ctx.add_failure(f"Invalid regex expression '{pattern_str}'.")
         results.append(pattern_ctx.to_result())
         return results
 
@@ -161,11 +256,7 @@ def check_attribute_suite(
         try:
             for val in values:
                 if cv_collection_key:
-                    term = voc.get_term_in_collection(
-                        project_id=project_name,
-                        collection_id=cv_collection,
-                        term_id=cv_collection_key,
-                    )
+                    term = _get_term(project_name, cv_collection, cv_collection_key)
 
                     if not term:
                         vocab_ctx.add_failure(
@@ -180,9 +271,7 @@ def check_attribute_suite(
                         invalid.append(val)
 
                 else:
-                    if not voc.valid_term_in_collection(
-                        value=val, project_id=project_name, collection_id=cv_collection
-                    ):
+                    if not _is_valid_term(val, project_name, cv_collection):
                         invalid.append(val)
 
             if invalid:
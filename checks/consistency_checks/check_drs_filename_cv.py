@@ -14,6 +14,17 @@ try:
 except ImportError:
     ESG_VOCAB_AVAILABLE = False
 
+_drs_validator_cache = {}
+
+
+def _get_drs_validator(project_id):
+    """Return a DrsValidator for project_id, built once per process."""
+    validator = _drs_validator_cache.get(project_id)
+    if validator is None:
+        validator = DrsValidator(project_id=project_id)
+        _drs_validator_cache[project_id] = validator
+    return validator
+
 
 # ==============================================================================
 # == CHECK 1 Check filename against CMIP6 CV pattern
@@ -38,7 +49,7 @@ def check_drs_filename(ds, severity, project_id="cmip6"):
     filename = os.path.basename(filepath)
 
     try:
-        validator = DrsValidator(project_id=project_id)
+        validator = _get_drs_validator(project_id)
         file_report = validator.validate_file_name(filename)
 
         if file_report.errors:
@@ -82,7 +93,7 @@ def check_drs_directory(ds, severity, project_id="cmip6"):
         return [ctx.to_result()]
 
     try:
-        validator = DrsValidator(project_id=project_id)
+        validator = _get_drs_validator(project_id)
         dir_report = validator.validate_directory(drs_directory)
 
         if dir_report.errors:
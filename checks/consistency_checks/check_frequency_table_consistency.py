@@ -24,7 +24,7 @@ def check_frequency_table_id_consistency(ds, mapping, severity):
             else:
                 msg = (
                     f"Inconsistency found. For table_id '{table_id}', "
-                    f"frequency should be one of {allowed_frequencies}, "
+                    f"frequency should be one of {sorted(allowed_frequencies)}, "
                     f"but found '{frequency}'."
                 )
                 ctx.add_failure(msg)
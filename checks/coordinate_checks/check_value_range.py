@@ -45,6 +45,12 @@ def _check_value_range(ds, var_name, min_val, max_val, check_id, severity):
             ctx.add_pass()
             return [ctx.to_result()]
 
+        # Two reductions settle the common, in-range case without
+        # allocating boolean masks over the whole array.
+        if data.min() >= min_val and data.max() <= max_val:
+            ctx.add_pass()
+            return [ctx.to_result()]
+
         below_min = data < min_val
         above_max = data > max_val
         outside_range = below_min | above_max
@@ -10,6 +10,17 @@ For specific V* check IDs, we use focused helper functions.
 from compliance_checker.base import BaseCheck, TestCtx
 import numpy as np
 
+from ..utils import get_attribute, get_attributes
+
+_MISSING = object()
+
+# Python types accepted for each expected attribute type
+_ATTR_TYPES = {
+    "str": (str, np.str_),
+    "float": (float, np.floating),
+    "int": (int, np.integer),
+}
+
 
 def _check_attr_exists(ds, var_name, attr_name, check_id, severity):
     """
@@ -39,8 +50,7 @@ def _check_attr_exists(ds, var_name, attr_name, check_id, severity):
         ctx.add_failure(f"Variable '{var_name}' not found in dataset.")
         return [ctx.to_result()]
 
-    var = ds.variables[var_name]
-    if hasattr(var, attr_name) or attr_name in var.ncattrs():
+    if get_attribute(ds, var_name, attr_name, _MISSING) is not _MISSING:
         ctx.add_pass()
     else:
         ctx.add_failure(f"Attribute '{attr_name}' not found on variable '{var_name}'.")
@@ -77,19 +87,12 @@ def _check_attr_type(ds, var_name, attr_name, expected_type, check_id, severity)
     if var_name not in ds.variables:
         return []
 
-    var = ds.variables[var_name]
     try:
-        attr_val = getattr(var, attr_name, None)
+        attr_val = get_attribute(ds, var_name, attr_name)
         if attr_val is None:
             return []
 
-        type_map = {
-            "str": (str, np.str_),
-            "float": (float, np.floating),
-            "int": (int, np.integer),
-        }
-
-        expected_py_type = type_map.get(expected_type)
+        expected_py_type = _ATTR_TYPES.get(expected_type)
         if expected_py_type is None:
             ctx.add_failure(f"Unknown expected type '{expected_type}'.")
             return [ctx.to_result()]
@@ -107,7 +110,53 @@ def _check_attr_type(ds, var_name, attr_name, expected_type, check_id, severity)
     return [ctx.to_result()]
 
 
-def _check_attr_utf8(ds, var_name, attr_name, check_id, severity):
+def validate_attrs_utf8(ds, var_name, attr_names):
+    """
+    Validate the UTF-8 encoding of several string attributes of a variable at once.
+
+    All string attribute values are joined into a single buffer and encoded in one
+    call. Only if that fails are the attributes encoded one by one to find out
+    which of them is invalid.
+
+    Parameters
+    ----------
+    ds : netCDF4.Dataset
+        The dataset.
+    var_name : str
+        The variable holding the attributes.
+    attr_names : iterable of str
+        The names of the attributes to validate (e.g., ('axis', 'units')).
+
+    Returns
+    -------
+    dict[str, bool]
+        Maps each attribute that is present and of type str to its UTF-8 validity.
+        Missing or non-string attributes are not included.
+    """
+    attrs = get_attributes(ds, var_name)
+    values = {}
+    for attr_name in attr_names:
+        attr_val = attrs.get(attr_name)
+        if isinstance(attr_val, str):
+            values[attr_name] = attr_val
+
+    try:
+        "\x1f".join(values.values()).encode("utf-8")
+        return dict.fromkeys(values, True)
+    except UnicodeEncodeError:
+        pass
+
+    status = {}
+    for attr_name, attr_val in values.items():
+        try:
+            attr_val.encode("utf-8")
+            status[attr_name] = True
+        except UnicodeEncodeError:
+            status[attr_name] = False
+    return status
+
+
+def _check_attr_utf8(ds, var_name, attr_name, check_id, severity, utf8_status=None):
     """
     Internal helper to verify a string attribute contains valid UTF-8 encoding.
 
@@ -123,6 +172,9 @@ def _check_attr_utf8(ds, var_name, attr_name, check_id, severity):
         The unique check identifier (e.g., 'V006').
     severity : int
         The severity level (BaseCheck.HIGH, BaseCheck.MEDIUM, BaseCheck.LOW).
+    utf8_status : dict[str, bool], optional
+        Precomputed result of validate_attrs_utf8 for this variable. If given,
+        the attribute is looked up instead of being encoded again.
 
     Returns
     -------
@@ -134,9 +186,17 @@ def _check_attr_utf8(ds, var_name, attr_name, check_id, severity):
     if var_name not in ds.variables:
         return []
 
-    var = ds.variables[var_name]
+    if utf8_status is not None:
+        if attr_name not in utf8_status:
+            return []
+        if utf8_status[attr_name]:
+            ctx.add_pass()
+        else:
+            ctx.add_failure(f"Attribute '{var_name}.{attr_name}' contains non-UTF-8 characters.")
+        return [ctx.to_result()]
+
     try:
-        attr_val = getattr(var, attr_name, None)
+        attr_val = get_attribute(ds, var_name, attr_name)
         if attr_val is None or not isinstance(attr_val, str):
             return []
 
@@ -182,9 +242,8 @@ def _check_attr_value(ds, var_name, attr_name, expected_value, check_id, severit
         ctx.add_failure(f"Variable '{var_name}' not found in dataset.")
         return [ctx.to_result()]
 
-    var = ds.variables[var_name]
     try:
-        attr_val = getattr(var, attr_name, None)
+        attr_val = get_attribute(ds, var_name, attr_name)
         if attr_val is None:
             ctx.add_failure(f"Attribute '{attr_name}' not found on variable '{var_name}'.")
             return [ctx.to_result()]
@@ -209,6 +268,18 @@ def _check_attr_value(ds, var_name, attr_name, expected_value, check_id, severit
     return [ctx.to_result()]
 
 
+# String attributes covered by a UTF-8 check, per coordinate variable.
+UTF8_ATTRIBUTES = {
+    "height": ("axis", "standard_name", "long_name", "units", "positive"),
+    "lat": ("axis", "standard_name", "long_name", "units", "bounds"),
+    "lon": ("axis", "standard_name", "long_name", "units", "bounds"),
+    "i": ("units", "long_name"),
+    "j": ("units", "long_name"),
+    "vertices_latitude": ("units",),
+    "vertices_longitude": ("units",),
+}
+
+
 # ===========================================================================
 # HEIGHT ATTRIBUTE CHECKS
 # ===========================================================================
@@ -219,8 +290,8 @@ def check_height_axis_exists(ds, severity=BaseCheck.MEDIUM):
 def check_height_axis_type(ds, severity=BaseCheck.MEDIUM):
     return _check_attr_type(ds, "height", "axis", "str", "V005", severity)
 
-def check_height_axis_utf8(ds, severity=BaseCheck.LOW):
-    return _check_attr_utf8(ds, "height", "axis", "V006", severity)
+def check_height_axis_utf8(ds, severity=BaseCheck.LOW, utf8_status=None):
+    return _check_attr_utf8(ds, "height", "axis", "V006", severity, utf8_status)
 
 def check_height_axis_value(ds, severity=BaseCheck.MEDIUM):
     return _check_attr_value(ds, "height", "axis", "Z", "V007", severity)
@@ -228,8 +299,8 @@ def check_height_axis_value(ds, severity=BaseCheck.MEDIUM):
 def check_height_standard_name_type(ds, severity=BaseCheck.MEDIUM):
     return _check_attr_type(ds, "height", "standard_name", "str", "V009", severity)
 
-def check_height_standard_name_utf8(ds, severity=BaseCheck.LOW):
-    return _check_attr_utf8(ds, "height", "standard_name", "V010", severity)
+def check_height_standard_name_utf8(ds, severity=BaseCheck.LOW, utf8_status=None):
+    return _check_attr_utf8(ds, "height", "standard_name", "V010", severity, utf8_status)
 
 def check_height_standard_name_value(ds, severity=BaseCheck.MEDIUM):
     return _check_attr_value(ds, "height", "standard_name", "height", "V011", severity)
@@ -240,8 +311,8 @@ def check_height_long_name_exists(ds, severity=BaseCheck.MEDIUM):
 def check_height_long_name_type(ds, severity=BaseCheck.MEDIUM):
     return _check_attr_type(ds, "height", "long_name", "str", "V013", severity)
 
-def check_height_long_name_utf8(ds, severity=BaseCheck.LOW):
-    return _check_attr_utf8(ds, "height", "long_name", "V014", severity)
+def check_height_long_name_utf8(ds, severity=BaseCheck.LOW, utf8_status=None):
+    return _check_attr_utf8(ds, "height", "long_name", "V014", severity, utf8_status)
 
 def check_height_long_name_value(ds, severity=BaseCheck.MEDIUM):
     return _check_attr_value(ds, "height", "long_name", "height", "V015", severity, case_insensitive=True)
@@ -249,14 +320,14 @@ def check_height_long_name_value(ds, severity=BaseCheck.MEDIUM):
 def check_height_units_type(ds, severity=BaseCheck.MEDIUM):
     return _check_attr_type(ds, "height", "units", "str", "V017", severity)
 
-def check_height_units_utf8(ds, severity=BaseCheck.LOW):
-    return _check_attr_utf8(ds, "height", "units", "V018", severity)
+def check_height_units_utf8(ds, severity=BaseCheck.LOW, utf8_status=None):
+    return _check_attr_utf8(ds, "height", "units", "V018", severity, utf8_status)
 
 def check_height_positive_type(ds, severity=BaseCheck.MEDIUM):
     return _check_attr_type(ds, "height", "positive", "str", "V021", severity)
 
-def check_height_positive_utf8(ds, severity=BaseCheck.LOW):
-    return _check_attr_utf8(ds, "height", "positive", "V022", severity)
+def check_height_positive_utf8(ds, severity=BaseCheck.LOW, utf8_status=None):
+    return _check_attr_utf8(ds, "height", "positive", "V022", severity, utf8_status)
 
 
 # ===========================================================================
@@ -266,8 +337,8 @@ def check_height_positive_utf8(ds, severity=BaseCheck.LOW):
 def check_lat_axis_type(ds, severity=BaseCheck.MEDIUM):
     return _check_attr_type(ds, "lat", "axis", "str", "V046", severity)
 
-def check_lat_axis_utf8(ds, severity=BaseCheck.LOW):
-    return _check_attr_utf8(ds, "lat", "axis", "V047", severity)
+def check_lat_axis_utf8(ds, severity=BaseCheck.LOW, utf8_status=None):
+    return _check_attr_utf8(ds, "lat", "axis", "V047", severity, utf8_status)
 
 def check_lat_axis_value(ds, severity=BaseCheck.MEDIUM):
     return _check_attr_value(ds, "lat", "axis", "Y", "V048", severity)
@@ -275,8 +346,8 @@ def check_lat_axis_value(ds, severity=BaseCheck.MEDIUM):
 def check_lat_standard_name_type(ds, severity=BaseCheck.MEDIUM):
     return _check_attr_type(ds, "lat", "standard_name", "str", "V050", severity)
 
-def check_lat_standard_name_utf8(ds, severity=BaseCheck.LOW):
-    return _check_attr_utf8(ds, "lat", "standard_name", "V051", severity)
+def check_lat_standard_name_utf8(ds, severity=BaseCheck.LOW, utf8_status=None):
+    return _check_attr_utf8(ds, "lat", "standard_name", "V051", severity, utf8_status)
 
 def check_lat_long_name_exists(ds, severity=BaseCheck.MEDIUM):
     return _check_attr_exists(ds, "lat", "long_name", "V053", severity)
@@ -284,8 +355,8 @@ def check_lat_long_name_exists(ds, severity=BaseCheck.MEDIUM):
 def check_lat_long_name_type(ds, severity=BaseCheck.MEDIUM):
     return _check_attr_type(ds, "lat", "long_name", "str", "V054", severity)
 
-def check_lat_long_name_utf8(ds, severity=BaseCheck.LOW):
-    return _check_attr_utf8(ds, "lat", "long_name", "V055", severity)
+def check_lat_long_name_utf8(ds, severity=BaseCheck.LOW, utf8_status=None):
+    return _check_attr_utf8(ds, "lat", "long_name", "V055", severity, utf8_status)
 
 def check_lat_long_name_value(ds, severity=BaseCheck.MEDIUM):
     return _check_attr_value(ds, "lat", "long_name", "latitude", "V056", severity, case_insensitive=True)
@@ -293,8 +364,8 @@ def check_lat_long_name_value(ds, severity=BaseCheck.MEDIUM):
 def check_lat_units_type(ds, severity=BaseCheck.MEDIUM):
     return _check_attr_type(ds, "lat", "units", "str", "V058", severity)
 
-def check_lat_units_utf8(ds, severity=BaseCheck.LOW):
-    return _check_attr_utf8(ds, "lat", "units", "V059", severity)
+def check_lat_units_utf8(ds, severity=BaseCheck.LOW, utf8_status=None):
+    return _check_attr_utf8(ds, "lat", "units", "V059", severity, utf8_status)
 
 def check_lat_bounds_exists(ds, severity=BaseCheck.MEDIUM):
     return _check_attr_exists(ds, "lat", "bounds", "V061", severity)
@@ -302,8 +373,8 @@ def check_lat_bounds_exists(ds, severity=BaseCheck.MEDIUM):
 def check_lat_bounds_type(ds, severity=BaseCheck.MEDIUM):
     return _check_attr_type(ds, "lat", "bounds", "str", "V062", severity)
 
-def check_lat_bounds_utf8(ds, severity=BaseCheck.LOW):
-    return _check_attr_utf8(ds, "lat", "bounds", "V063", severity)
+def check_lat_bounds_utf8(ds, severity=BaseCheck.LOW, utf8_status=None):
+    return _check_attr_utf8(ds, "lat", "bounds", "V063", severity, utf8_status)
 
 def check_lat_actual_range_exists(ds, severity=BaseCheck.LOW):
     return _check_attr_exists(ds, "lat", "actual_range", "V065", severity)
@@ -319,8 +390,8 @@ def check_lat_actual_range_type(ds, severity=BaseCheck.MEDIUM):
 def check_lon_axis_type(ds, severity=BaseCheck.MEDIUM):
     return _check_attr_type(ds, "lon", "axis", "str", "V084", severity)
 
-def check_lon_axis_utf8(ds, severity=BaseCheck.LOW):
-    return _check_attr_utf8(ds, "lon", "axis", "V085", severity)
+def check_lon_axis_utf8(ds, severity=BaseCheck.LOW, utf8_status=None):
+    return _check_attr_utf8(ds, "lon", "axis", "V085", severity, utf8_status)
 
 def check_lon_axis_value(ds, severity=BaseCheck.MEDIUM):
     return _check_attr_value(ds, "lon", "axis", "X", "V086", severity)
@@ -328,8 +399,8 @@ def check_lon_axis_value(ds, severity=BaseCheck.MEDIUM):
 def check_lon_standard_name_type(ds, severity=BaseCheck.MEDIUM):
     return _check_attr_type(ds, "lon", "standard_name", "str", "V088", severity)
 
-def check_lon_standard_name_utf8(ds, severity=BaseCheck.LOW):
-    return _check_attr_utf8(ds, "lon", "standard_name", "V089", severity)
+def check_lon_standard_name_utf8(ds, severity=BaseCheck.LOW, utf8_status=None):
+    return _check_attr_utf8(ds, "lon", "standard_name", "V089", severity, utf8_status)
 
 def check_lon_long_name_exists(ds, severity=BaseCheck.MEDIUM):
     return _check_attr_exists(ds, "lon", "long_name", "V091", severity)
@@ -337,8 +408,8 @@ def check_lon_long_name_exists(ds, severity=BaseCheck.MEDIUM):
 def check_lon_long_name_type(ds, severity=BaseCheck.MEDIUM):
     return _check_attr_type(ds, "lon", "long_name", "str", "V092", severity)
 
-def check_lon_long_name_utf8(ds, severity=BaseCheck.LOW):
-    return _check_attr_utf8(ds, "lon", "long_name", "V093", severity)
+def check_lon_long_name_utf8(ds, severity=BaseCheck.LOW, utf8_status=None):
+    return _check_attr_utf8(ds, "lon", "long_name", "V093", severity, utf8_status)
 
 def check_lon_long_name_value(ds, severity=BaseCheck.MEDIUM):
     return _check_attr_value(ds, "lon", "long_name", "longitude", "V094", severity, case_insensitive=True)
@@ -346,8 +417,8 @@ def check_lon_long_name_value(ds, severity=BaseCheck.MEDIUM):
 def check_lon_units_type(ds, severity=BaseCheck.MEDIUM):
     return _check_attr_type(ds, "lon", "units", "str", "V096", severity)
 
-def check_lon_units_utf8(ds, severity=BaseCheck.LOW):
-    return _check_attr_utf8(ds, "lon", "units", "V097", severity)
+def check_lon_units_utf8(ds, severity=BaseCheck.LOW, utf8_status=None):
+    return _check_attr_utf8(ds, "lon", "units", "V097", severity, utf8_status)
 
 def check_lon_bounds_exists(ds, severity=BaseCheck.MEDIUM):
     return _check_attr_exists(ds, "lon", "bounds", "V099", severity)
@@ -355,8 +426,8 @@ def check_lon_bounds_exists(ds, severity=BaseCheck.MEDIUM):
 def check_lon_bounds_type(ds, severity=BaseCheck.MEDIUM):
     return _check_attr_type(ds, "lon", "bounds", "str", "V100", severity)
 
-def check_lon_bounds_utf8(ds, severity=BaseCheck.LOW):
-    return _check_attr_utf8(ds, "lon", "bounds", "V101", severity)
+def check_lon_bounds_utf8(ds, severity=BaseCheck.LOW, utf8_status=None):
+    return _check_attr_utf8(ds, "lon", "bounds", "V101", severity, utf8_status)
 
 def check_lon_actual_range_exists(ds, severity=BaseCheck.LOW):
     return _check_attr_exists(ds, "lon", "actual_range", "V103", severity)
@@ -375,8 +446,8 @@ def check_i_units_exists(ds, severity=BaseCheck.MEDIUM):
 def check_i_units_type(ds, severity=BaseCheck.MEDIUM):
     return _check_attr_type(ds, "i", "units", "str", "V229", severity)
 
-def check_i_units_utf8(ds, severity=BaseCheck.LOW):
-    return _check_attr_utf8(ds, "i", "units", "V230", severity)
+def check_i_units_utf8(ds, severity=BaseCheck.LOW, utf8_status=None):
+    return _check_attr_utf8(ds, "i", "units", "V230", severity, utf8_status)
 
 def check_i_units_value(ds, severity=BaseCheck.MEDIUM):
     return _check_attr_value(ds, "i", "units", "1", "V231", severity)
@@ -387,8 +458,8 @@ def check_i_long_name_exists(ds, severity=BaseCheck.MEDIUM):
 def check_i_long_name_type(ds, severity=BaseCheck.MEDIUM):
     return _check_attr_type(ds, "i", "long_name", "str", "V233", severity)
 
-def check_i_long_name_utf8(ds, severity=BaseCheck.LOW):
-    return _check_attr_utf8(ds, "i", "long_name", "V234", severity)
+def check_i_long_name_utf8(ds, severity=BaseCheck.LOW, utf8_status=None):
+    return _check_attr_utf8(ds, "i", "long_name", "V234", severity, utf8_status)
 
 def check_i_long_name_value(ds, severity=BaseCheck.MEDIUM):
     return _check_attr_value(ds, "i", "long_name", "cell index", "V235", severity, case_insensitive=True)
@@ -404,8 +475,8 @@ def check_j_units_exists(ds, severity=BaseCheck.MEDIUM):
 def check_j_units_type(ds, severity=BaseCheck.MEDIUM):
     return _check_attr_type(ds, "j", "units", "str", "V237", severity)
 
-def check_j_units_utf8(ds, severity=BaseCheck.LOW):
-    return _check_attr_utf8(ds, "j", "units", "V238", severity)
+def check_j_units_utf8(ds, severity=BaseCheck.LOW, utf8_status=None):
+    return _check_attr_utf8(ds, "j", "units", "V238", severity, utf8_status)
 
 def check_j_units_value(ds, severity=BaseCheck.MEDIUM):
     return _check_attr_value(ds, "j", "units", "1", "V239", severity)
@@ -416,8 +487,8 @@ def check_j_long_name_exists(ds, severity=BaseCheck.MEDIUM):
 def check_j_long_name_type(ds, severity=BaseCheck.MEDIUM):
     return _check_attr_type(ds, "j", "long_name", "str", "V241", severity)
 
-def check_j_long_name_utf8(ds, severity=BaseCheck.LOW):
-    return _check_attr_utf8(ds, "j", "long_name", "V242", severity)
+def check_j_long_name_utf8(ds, severity=BaseCheck.LOW, utf8_status=None):
+    return _check_attr_utf8(ds, "j", "long_name", "V242", severity, utf8_status)
 
 def check_j_long_name_value(ds, severity=BaseCheck.MEDIUM):
     return _check_attr_value(ds, "j", "long_name", "cell index", "V243", severity, case_insensitive=True)
@@ -433,8 +504,8 @@ def check_vertices_latitude_units_exists(ds, severity=BaseCheck.MEDIUM):
 def check_vertices_latitude_units_type(ds, severity=BaseCheck.MEDIUM):
     return _check_attr_type(ds, "vertices_latitude", "units", "str", "V245", severity)
 
-def check_vertices_latitude_units_utf8(ds, severity=BaseCheck.LOW):
-    return _check_attr_utf8(ds, "vertices_latitude", "units", "V246", severity)
+def check_vertices_latitude_units_utf8(ds, severity=BaseCheck.LOW, utf8_status=None):
+    return _check_attr_utf8(ds, "vertices_latitude", "units", "V246", severity, utf8_status)
 
 def check_vertices_latitude_units_value(ds, severity=BaseCheck.MEDIUM):
     return _check_attr_value(ds, "vertices_latitude", "units", "degrees_north", "V247", severity)
@@ -462,8 +533,8 @@ def check_vertices_longitude_units_exists(ds, severity=BaseCheck.MEDIUM):
 def check_vertices_longitude_units_type(ds, severity=BaseCheck.MEDIUM):
     return _check_attr_type(ds, "vertices_longitude", "units", "str", "V255", severity)
 
-def check_vertices_longitude_units_utf8(ds, severity=BaseCheck.LOW):
-    return _check_attr_utf8(ds, "vertices_longitude", "units", "V256", severity)
+def check_vertices_longitude_units_utf8(ds, severity=BaseCheck.LOW, utf8_status=None):
+    return _check_attr_utf8(ds, "vertices_longitude", "units", "V256", severity, utf8_status)
 
 def check_vertices_longitude_units_value(ds, severity=BaseCheck.MEDIUM):
     return _check_attr_value(ds, "vertices_longitude", "units", "degrees_east", "V257", severity)
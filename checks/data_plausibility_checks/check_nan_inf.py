@@ -16,6 +16,7 @@ from checks.data_plausibility_checks.utils.auxiliar import (
     Coordinate,
     dump_data_file_extended
 )
+from checks.utils import read_variable
 
 def check_any_nan(data_slice):
     """Check if there are any NaN values in the data slice."""
@@ -25,6 +26,10 @@ def check_any_inf(data_slice):
     """Check if there are any infinite values in the data slice."""
     return np.any(np.isinf(data_slice))
 
+def _is_integral(data_slice):
+    """Integer and boolean arrays cannot hold NaN or Inf, so need no scan."""
+    return getattr(data_slice, "dtype", None) is not None and data_slice.dtype.kind in "biu"
+
 def get_nan_coordinates(data_slice):
     """Get the coordinates of all NaN values in the data slice."""
     return np.where(np.isnan(data_slice))
@@ -35,6 +40,51 @@ def get_inf_coordinates(data_slice):
 
 
 
+def _nan_inf_ctx(dataset, variable, parameter, severity):
+    return ExtendedTestCtx(
+        category=severity,
+        description=f"Check for {parameter} values in the dataset.",
+        dataset_name=getattr(dataset, "filepath", lambda: "unknown")(),
+        test_function="check_nan_inf",
+        parameters={"parameter": parameter},
+        variable=variable,
+    )
+
+
+def _read_raw(dataset, variable):
+    """Read the raw (unmasked, unscaled) data and the _FillValue of a variable."""
+    var = dataset.variables[variable]
+    var.set_auto_mask(False)
+    var.set_auto_scale(False)
+    return read_variable(dataset, variable), getattr(var, '_FillValue', None)
+
+
+def _record_nan_inf(ctx, dataset, variable, parameter, data, check):
+    """Record the outcome of a NaN or Inf check on ctx."""
+    if check:
+        if parameter == "NaN":
+            coords = get_nan_coordinates(data)
+        elif parameter == "Inf":
+            coords = get_inf_coordinates(data)
+        else:
+            coords = []
+
+        # One (N, ndim) array converted in C, rather than casting per element
+        coord_list = np.transpose(coords).tolist()
+
+        name = parameter.lower()
+        ctx.coordinates.extend(
+            Coordinate(name=name, indices=[tuple(coord)], values=[True], result=True)
+            for coord in coord_list
+        )
+
+        ctx.add_failure(f"{parameter} values detected: {len(coord_list)}")
+        dump_data_file_extended(dataset, variable, 'check_nan_inf', ctx)
+    else:
+        ctx.messages.append(f"No {parameter} detected in the dataset.")
+        ctx.add_pass()
+
+
 def check_nan_inf(dataset, variable, parameter="NaN", severity=BaseCheck.MEDIUM):
     """
     Check for NaN or Inf values in a dataset. The function inspects the specified variable
@@ -53,56 +103,67 @@ def check_nan_inf(dataset, variable, parameter="NaN", severity=BaseCheck.MEDIUM)
       pass/failure status, messages, and coordinates of detected outliers.
     - file: A file containing the coordinates and values of detected outliers is written when the check condition fails.
     """
-    ctx = ExtendedTestCtx(
-        category=severity,
-        description=f"Check for {parameter} values in the dataset.",
-        dataset_name=getattr(dataset, "filepath", lambda: "unknown")(),
-        test_function="check_nan_inf",
-        parameters={"parameter": parameter},
-        variable=variable,
-    )
-
-    var = dataset.variables[variable]
-    var.set_auto_mask(False)
-    var.set_auto_scale(False)
-    data = var[:]
-    fill_value = getattr(var, '_FillValue', None)
+    ctx = _nan_inf_ctx(dataset, variable, parameter, severity)
+    data, fill_value = _read_raw(dataset, variable)
 
     if fill_value is not None and np.isnan(fill_value):
         ctx.add_failure("Warning: _FillValue is NaN. See Fill_value check for more information.")
         return ctx
     try:
-        if parameter == "NaN":
+        if _is_integral(data):
+            check = False
+        elif parameter == "NaN":
             check = check_any_nan(data)
         elif parameter == "Inf":
             check = check_any_inf(data)
     except Exception as e:
         ctx.add_failure(f"Error during {parameter} check: {e}")
+        return ctx
 
-    if check:
-        if parameter == "NaN":
-            coords = get_nan_coordinates(data)
-        elif parameter == "Inf":
-            coords = get_inf_coordinates(data)
-        else:
-            coords = []
+    _record_nan_inf(ctx, dataset, variable, parameter, data, check)
+    return ctx
 
-        coord_list = list(zip(*coords))
 
-        for coord in coord_list:
-            clean_coord = tuple(map(int, coord))  
-            coord_obj = Coordinate(
-                name=parameter.lower(),
-                indices=[clean_coord],
-                values=[True],
-                result=True
-            )
-            ctx.coordinates.append(coord_obj)
+def check_nan_and_inf(dataset, variable, severity=BaseCheck.MEDIUM, inf_severity=None):
+    """
+    Run the NaN and the Inf check of check_nan_inf on a single read of the data.
 
-        ctx.add_failure(f"{parameter} values detected: {len(coord_list)}")
-        dump_data_file_extended(dataset, variable, 'check_nan_inf', ctx)
-    else:
-        ctx.messages.append(f"No {parameter} detected in the dataset.")
-        ctx.add_pass()
+    One np.isfinite pass settles both checks when all values are finite, the
+    usual case; only otherwise are NaN and Inf values located separately.
+
+    Parameters:
+    - severity : The severity level of the NaN check, and of the Inf check
+      unless inf_severity is given.
+    - inf_severity : The severity level of the Inf check.
+
+    Returns:
+    - tuple(TestCtx, TestCtx): the NaN and the Inf results, as check_nan_inf
+      with parameter="NaN" and parameter="Inf" would return them.
+    """
+    if inf_severity is None:
+        inf_severity = severity
+    ctx_nan = _nan_inf_ctx(dataset, variable, "NaN", severity)
+    ctx_inf = _nan_inf_ctx(dataset, variable, "Inf", inf_severity)
+    data, fill_value = _read_raw(dataset, variable)
 
-    return ctx
\ No newline at end of file
+    if fill_value is not None and np.isnan(fill_value):
+        for ctx in (ctx_nan, ctx_inf):
+            ctx.add_failure("Warning: _FillValue is NaN. See Fill_value check for more information.")
+        return ctx_nan, ctx_inf
+
+    try:
+        all_finite = _is_integral(data) or np.all(np.isfinite(data))
+    except Exception:
+        # Let each check report its own error, as check_nan_inf does
+        return (
+            check_nan_inf(dataset, variable, "NaN", severity),
+            check_nan_inf(dataset, variable, "Inf", inf_severity),
+        )
+
+    if all_finite:
+        _record_nan_inf(ctx_nan, dataset, variable, "NaN", data, False)
+        _record_nan_inf(ctx_inf, dataset, variable, "Inf", data, False)
+    else:
+        _record_nan_inf(ctx_nan, dataset, variable, "NaN", data, check_any_nan(data))
+        _record_nan_inf(ctx_inf, dataset, variable, "Inf", data, check_any_inf(data))
+    return ctx_nan, ctx_inf
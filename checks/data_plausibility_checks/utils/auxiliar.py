@@ -76,6 +76,8 @@ def dump_data_file_extended(dataset, variable, check_name, ctx, options=''):
 
 
 class Coordinate:
+    __slots__ = ("name", "indices", "values", "result", "values_dict")
+
     def __init__(self, name, indices=None, values=None, result=None):
         self.name = name
         self.indices = indices if indices is not None else []
@@ -0,0 +1,56 @@
+#!/usr/bin/env python
+
+"""
+check_dimension_triad.py
+
+Run the existence, positive size and coordinate variable checks of a
+dimension in one pass over the netCDF dataset.
+
+Intended to be included in the WCRP plugins.
+"""
+
+from compliance_checker.base import BaseCheck, TestCtx
+
+
+def check_dimension_triad(ds, dimension_name, severity=BaseCheck.MEDIUM):
+    """
+    Verify that a dimension exists (DIM001), has a positive size (DIM002)
+    and has a variable of the same name (VAR001).
+
+    The dimension and the variable are looked up once; the results and
+    messages are those of check_dimension_existence,
+    check_dimension_positive and check_variable_existence.
+
+    Returns
+    -------
+    List[Result]
+        The DIM001, DIM002 and VAR001 results, in that order.
+    """
+    dim = ds.dimensions.get(dimension_name)
+
+    exists_ctx = TestCtx(severity, f"[DIM001] Dimension Existence: '{dimension_name}'")
+    positive_ctx = TestCtx(
+        severity,
+        f"[DIM002] Positive Integer Size Check for Dimension '{dimension_name}'",
+    )
+
+    if dim is None:
+        exists_ctx.add_failure(f"Dimension '{dimension_name}' is missing.")
+        positive_ctx.messages.append(
+            f"Dimension '{dimension_name}' not found, check skipped."
+        )
+    else:
+        exists_ctx.add_pass()
+        if dim.size > 0:
+            positive_ctx.add_pass()
+        else:
+            positive_ctx.add_failure(
+                f"Dimension '{dimension_name}' must have a positive size, but found {dim.size}."
+            )
+
+    var_ctx = TestCtx(severity, f"[VAR001] Variable Existence: '{dimension_name}'")
+    var_ctx.assert_true(
+        dimension_name in ds.variables, f"Variable '{dimension_name}' is missing."
+    )
+
+    return [exists_ctx.to_result(), positive_ctx.to_result(), var_ctx.to_result()]
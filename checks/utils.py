@@ -1,6 +1,7 @@
 import json
 import os
 import re
+import weakref
 from datetime import timedelta
 from pathlib import Path
 from typing import NamedTuple, Optional
@@ -334,6 +335,100 @@ def _compare_CV(CheckerObject, dic2comp, errmsg_prefix):
 
 # === Variable data utilities ===
 
+# Decoded data of the datasets registered with enable_read_cache, per
+# (variable name, auto-mask, auto-scale, always-mask, chartostring)
+_READ_CACHE = weakref.WeakKeyDictionary()
+# Attributes of the variables of those datasets, per variable name
+_ATTR_CACHE = weakref.WeakKeyDictionary()
+
+
+def enable_read_cache(ds):
+    """
+    Let read_variable decode each variable of ds only once per masking and
+    scaling mode, and get_attributes/get_attribute read each variable's
+    attributes only once. Meant for datasets that are only read, as in a
+    checker run; the cached arrays are shared and read-only, and the cached
+    dicts must not be modified in place.
+
+    Args:
+        ds: NetCDF dataset
+    """
+    _READ_CACHE[ds] = {}
+    _ATTR_CACHE[ds] = {}
+
+
+def read_variable(ds, var_name):
+    """
+    Read all data of a variable, as ds.variables[var_name][:] would.
+
+    Args:
+        ds: NetCDF dataset
+        var_name: Name of the variable to read
+
+    Returns:
+        The variable data; shared between callers and read-only if ds has
+        the read cache enabled
+    """
+    var = ds.variables[var_name]
+    cache = _READ_CACHE.get(ds)
+    if cache is None:
+        return var[:]
+    key = (var_name, var.mask, var.scale, var.always_mask, var.chartostring)
+    if key not in cache:
+        data = var[:]
+        if isinstance(data, np.ndarray) and data is not np.ma.masked:
+            # Shared between checks: in-place changes raise instead of
+            # silently altering what later checks read
+            data.flags.writeable = False
+            mask = np.ma.getmask(data)
+            if mask is not np.ma.nomask:
+                mask.flags.writeable = False
+        cache[key] = data
+    return cache[key]
+
+
+def get_attributes(ds, var_name):
+    """
+    Get all netCDF attributes of a variable.
+
+    Args:
+        ds: NetCDF dataset
+        var_name: Name of the variable
+
+    Returns:
+        dict mapping attribute names to values; if ds has the read cache
+        enabled, read once per variable and shared between callers
+    """
+    var = ds.variables[var_name]
+    cache = _ATTR_CACHE.get(ds)
+    if cache is None:
+        return {k: var.getncattr(k) for k in var.ncattrs()}
+    attrs = cache.get(var_name)
+    if attrs is None:
+        attrs = cache[var_name] = {k: var.getncattr(k) for k in var.ncattrs()}
+    return attrs
+
+
+def get_attribute(ds, var_name, attr_name, default=None):
+    """
+    Get an attribute of a variable, as getattr(variable, attr_name, default) would.
+
+    Args:
+        ds: NetCDF dataset
+        var_name: Name of the variable
+        attr_name: Name of the attribute
+        default: Returned if the attribute does not exist
+
+    Returns:
+        The attribute value; if ds has the read cache enabled, it is served
+        from the attributes snapshot of get_attributes
+    """
+    if ds in _ATTR_CACHE:
+        attrs = get_attributes(ds, var_name)
+        if attr_name in attrs:
+            return attrs[attr_name]
+    return getattr(ds.variables[var_name], attr_name, default)
+
 
 def get_variable_data(ds, var_name):
     """
@@ -349,15 +444,14 @@ def get_variable_data(ds, var_name):
     if var_name not in ds.variables:
         return None, f"Variable '{var_name}' not found in dataset."
 
-    var = ds.variables[var_name]
-    data = var[:]
+    data = read_variable(ds, var_name)
 
     # Handle masked arrays
     if hasattr(data, "compressed"):
         data = data.compressed()
 
-    # Flatten for consistent handling
-    data = np.asarray(data).flatten()
+    # Flatten for consistent handling (a view where possible, not a copy)
+    data = np.asarray(data).ravel()
     return data, None
 
 
@@ -375,7 +469,7 @@ def get_bounds_data(ds, bnds_var_name):
     if bnds_var_name not in ds.variables:
         return None, f"Bounds variable '{bnds_var_name}' not found in dataset."
 
-    bnds = ds.variables[bnds_var_name][:]
+    bnds = read_variable(ds, bnds_var_name)
 
     if bnds.ndim != 2 or bnds.shape[1] != 2:
         return None, f"Bounds variable '{bnds_var_name}' has unexpected shape {bnds.shape}. Expected (n, 2) for interval bounds."
@@ -383,9 +477,71 @@ def get_bounds_data(ds, bnds_var_name):
     return bnds, None
 
 
+def first_value_outside_bounds(values, bounds):
+    """
+    Locate the first value lying outside its bounds interval.
+
+    Args:
+        values: 1-D coordinate values
+        bounds: Bounds array with one row of bounds per value
+
+    Returns:
+        tuple or None: (index, value, low, high) for the first value outside
+        [min(bounds[i]), max(bounds[i])], or None if all values lie within
+    """
+    if (
+        np.ndim(values) == 1
+        and np.ndim(bounds) == 2
+        and np.shape(bounds)[1] > 0
+        and not np.ma.is_masked(values)
+        and not np.ma.is_masked(bounds)
+    ):
+        n = min(len(values), len(bounds))
+        vals = np.asarray(values[:n])
+        bnds = np.asarray(bounds[:n])
+        # Python's min()/max() do not propagate NaN the way NumPy's do
+        if not (bnds.dtype.kind == "f" and np.isnan(bnds).any()):
+            low = bnds.min(axis=1)
+            high = bnds.max(axis=1)
+            outside = ~((low <= vals) & (vals <= high))
+            if not outside.any():
+                return None
+            i = int(outside.argmax())
+            return i, vals[i], low[i], high[i]
+
+    # Masked, NaN-bounded or irregularly shaped input: compare element-wise
+    for i, (val, bnds) in enumerate(zip(values, bounds)):
+        low = min(bnds)
+        high = max(bnds)
+        if not (low <= val <= high):
+            return i, val, low, high
+    return None
+
+
 # === Further utils ===
 
 
+def fuzzy_match_dim(expected, actuals, names=None):
+    """
+    Find the actual dimension matching an expected dimension name.
+
+    Args:
+        expected: Expected dimension name
+        actuals: Actual dimension names, in order
+        names: Optional set of the actual names, for repeated lookups
+
+    Returns:
+        expected if it is an actual name, else the first actual name that
+        contains it or is contained in it, or None
+    """
+    if expected in (actuals if names is None else names):
+        return expected
+    for a in actuals:
+        if a in expected or expected in a:
+            return a
+    return None
+
+
 def _find_drs_directory_and_filename(filepath, project_id="cmip6"):
     """
     Intelligently finds the DRS directory path by locating the project_id.
@@ -495,21 +651,40 @@ def get_cmor_coordinate_definitions():
         return {}
 
 
+_cmor_info_cache = None
+
+
 def get_cmor_coordinate_info(out_name):
-    """Get CMOR metadata for a coordinate variable."""
-    coords = get_cmor_coordinate_definitions()
-    for coord_def in coords.values():
-        if coord_def.get("out_name") == out_name:
-            return {
+    """
+    Get CMOR metadata for a coordinate variable.
+
+    The per-coordinate info is built once for all definitions, including
+    ``long_name_lc``, the casefolded long_name used for case-insensitive
+    comparisons.
+    """
+    global _cmor_info_cache
+    if _cmor_info_cache is None:
+        coords = get_cmor_coordinate_definitions()
+        if not coords:
+            return {}
+        info_by_name = {}
+        for coord_def in coords.values():
+            name = coord_def.get("out_name")
+            if name is None or name in info_by_name:
+                continue
+            long_name = coord_def.get("long_name", "")
+            info_by_name[name] = {
                 "standard_name": coord_def.get("standard_name", ""),
                 "units": coord_def.get("units", ""),
                 "axis": coord_def.get("axis", ""),
                 "valid_min": coord_def.get("valid_min", ""),
                 "valid_max": coord_def.get("valid_max", ""),
-                "long_name": coord_def.get("long_name", ""),
+                "long_name": long_name,
+                "long_name_lc": long_name.casefold(),
                 "must_have_bounds": coord_def.get("must_have_bounds", "") == "yes",
             }
-    return {}
+        _cmor_info_cache = info_by_name
+    return _cmor_info_cache.get(out_name, {})
 
 
 # ---------------------------------------------------------------------------
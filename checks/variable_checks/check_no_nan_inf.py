@@ -1,31 +1,24 @@
 #!/usr/bin/env python
 """
 This module provides atomic checks that verify whether specific variables
-contain no NaN or Inf values. Reuses check_nan_inf from data_plausibility_checks.
+contain no NaN or Inf values. Reuses check_nan_and_inf from data_plausibility_checks.
 """
 
 from compliance_checker.base import BaseCheck
-from checks.data_plausibility_checks.check_nan_inf import check_nan_inf
+from checks.data_plausibility_checks.check_nan_inf import check_nan_and_inf
 
 
 def _check_no_nan_inf(ds, var_name, check_id, severity):
     """
-    Internal helper to check for NaN and Inf values using existing check_nan_inf.
+    Internal helper to check for NaN and Inf values using check_nan_and_inf.
     Returns combined results for both NaN and Inf checks.
     """
-    results = []
     if var_name not in ds.variables:
-        return results
+        return []
 
-    # Check for NaN
-    ctx_nan = check_nan_inf(ds, var_name, parameter="NaN", severity=severity)
-    results.append(ctx_nan.to_result())
-
-    # Check for Inf
-    ctx_inf = check_nan_inf(ds, var_name, parameter="Inf", severity=severity)
-    results.append(ctx_inf.to_result())
-
-    return results
+    # NaN and Inf checks share one read of the data
+    ctx_nan, ctx_inf = check_nan_and_inf(ds, var_name, severity=severity)
+    return [ctx_nan.to_result(), ctx_inf.to_result()]
 
 
 # V033: lat no NaN/Inf values
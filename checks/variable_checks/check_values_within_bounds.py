@@ -6,7 +6,8 @@ Each function uses a specific check ID.
 """
 
 from compliance_checker.base import BaseCheck, TestCtx
-import numpy as np
+
+from ..utils import first_value_outside_bounds, read_variable
 
 
 def _check_values_within_bounds(ds, var_name, check_id, severity):
@@ -30,24 +31,19 @@ def _check_values_within_bounds(ds, var_name, check_id, severity):
         ctx.add_failure(f"Bounds variable '{bounds_name}' not found.")
         return [ctx.to_result()]
 
-    bounds_var = ds.variables[bounds_name]
-    values = var[:]
-    bounds = bounds_var[:]
+    values = read_variable(ds, var_name)
+    bounds = read_variable(ds, bounds_name)
 
     try:
-        all_within = True
-        for i, (val, bnds) in enumerate(zip(values, bounds)):
-            low = min(bnds)
-            high = max(bnds)
-            if not (low <= val <= high):
-                ctx.add_failure(
-                    f"Value {val} at index {i} is outside bounds [{low}, {high}]."
-                )
-                all_within = False
-                break  # Report first failure only
-
-        if all_within:
+        outside = first_value_outside_bounds(values, bounds)
+        if outside is None:
             ctx.add_pass()
+        else:
+            # Report first failure only
+            i, val, low, high = outside
+            ctx.add_failure(
+                f"Value {val} at index {i} is outside bounds [{low}, {high}]."
+            )
     except Exception as e:
         ctx.add_failure(f"Error checking bounds consistency: {e}")
 
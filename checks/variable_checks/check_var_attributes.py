@@ -10,6 +10,17 @@ For specific V* check IDs, we use focused helper functions.
 from compliance_checker.base import BaseCheck, TestCtx
 import numpy as np
 
+from ..utils import get_attribute
+
+_MISSING = object()
+
+# Python types accepted for each expected attribute type
+_ATTR_TYPES = {
+    "str": (str, np.str_),
+    "float": (float, np.floating),
+    "int": (int, np.integer),
+}
+
 
 def _check_attr_exists(ds, var_name, attr_name, check_id, severity):
     """Check that an attribute exists on a variable."""
@@ -19,8 +30,7 @@ def _check_attr_exists(ds, var_name, attr_name, check_id, severity):
         ctx.add_failure(f"Variable '{var_name}' not found in dataset.")
         return [ctx.to_result()]
 
-    var = ds.variables[var_name]
-    if hasattr(var, attr_name) or attr_name in var.ncattrs():
+    if get_attribute(ds, var_name, attr_name, _MISSING) is not _MISSING:
         ctx.add_pass()
     else:
         ctx.add_failure(f"Attribute '{attr_name}' not found on variable '{var_name}'.")
@@ -35,19 +45,12 @@ def _check_attr_type(ds, var_name, attr_name, expected_type, check_id, severity)
     if var_name not in ds.variables:
         return []
 
-    var = ds.variables[var_name]
     try:
-        attr_val = getattr(var, attr_name, None)
+        attr_val = get_attribute(ds, var_name, attr_name)
         if attr_val is None:
             return []
 
-        type_map = {
-            "str": (str, np.str_),
-            "float": (float, np.floating),
-            "int": (int, np.integer),
-        }
-
-        expected_py_type = type_map.get(expected_type)
+        expected_py_type = _ATTR_TYPES.get(expected_type)
         if expected_py_type is None:
             ctx.add_failure(f"Unknown expected type '{expected_type}'.")
             return [ctx.to_result()]
@@ -72,9 +75,8 @@ def _check_attr_utf8(ds, var_name, attr_name, check_id, severity):
     if var_name not in ds.variables:
         return []
 
-    var = ds.variables[var_name]
     try:
-        attr_val = getattr(var, attr_name, None)
+        attr_val = get_attribute(ds, var_name, attr_name)
         if attr_val is None or not isinstance(attr_val, str):
             return []
 
@@ -96,9 +98,8 @@ def _check_attr_value(ds, var_name, attr_name, expected_value, check_id, severit
         ctx.add_failure(f"Variable '{var_name}' not found in dataset.")
         return [ctx.to_result()]
 
-    var = ds.variables[var_name]
     try:
-        attr_val = getattr(var, attr_name, None)
+        attr_val = get_attribute(ds, var_name, attr_name)
         if attr_val is None:
             ctx.add_failure(f"Attribute '{attr_name}' not found on variable '{var_name}'.")
             return [ctx.to_result()]
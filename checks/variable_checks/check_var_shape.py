@@ -11,12 +11,12 @@ def _check_var_shape(ds, var_name, check_id, severity):
     """Internal helper to check variable shape with a specific check ID."""
     ctx = TestCtx(severity, f"[{check_id}] Variable Shape: '{var_name}'")
 
-    if var_name not in ds.variables:
+    var = ds.variables.get(var_name)
+    if var is None:
         ctx.add_failure(f"Variable '{var_name}' not found in dataset.")
         return [ctx.to_result()]
 
     try:
-        var = ds.variables[var_name]
         dims = var.dimensions
         shape = var.shape
 
@@ -26,9 +26,11 @@ def _check_var_shape(ds, var_name, check_id, severity):
             )
         else:
             mismatch = False
+            dimensions = ds.dimensions
             for dim_name, size in zip(dims, shape):
-                if dim_name in ds.dimensions:
-                    expected_size = len(ds.dimensions[dim_name])
+                dim = dimensions.get(dim_name)
+                if dim is not None:
+                    expected_size = len(dim)
                     if size != expected_size:
                         ctx.add_failure(
                             f"Variable '{var_name}' dimension '{dim_name}' has size {size}, "
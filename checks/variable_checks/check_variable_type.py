@@ -12,7 +12,7 @@ def check_variable_type(ds, variable_name, allowed_types=None, severity=BaseChec
 
     var = ds.variables[variable_name]
     if allowed_types is None:
-        allowed_types = ["f"]
+        allowed_types = ("f",)
 
     try:
         # .kind renvoie 'f' (float), 'i' (int), 'S' (string), etc.
@@ -25,7 +25,7 @@ def check_variable_type(ds, variable_name, allowed_types=None, severity=BaseChec
         ctx.add_pass()
     else:
         ctx.add_failure(
-            f"Variable '{variable_name}' has type '{dtype_kind}' (expected one of {allowed_types}). "
+            f"Variable '{variable_name}' has type '{dtype_kind}' (expected one of {list(allowed_types)}). "
             f"Full dtype: {var.dtype}"
         )
     return [ctx.to_result()]
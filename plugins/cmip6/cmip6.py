@@ -7,19 +7,47 @@ from __future__ import annotations
 
 import os
 import re
-from typing import Dict, Optional, List, Literal, Any, Tuple
+import sys
+from enum import Enum, IntEnum
+from functools import lru_cache
+from itertools import chain
+from types import MappingProxyType
+from typing import (
+    Annotated,
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    List,
+    Literal,
+    Mapping,
+    NamedTuple,
+    Tuple,
+)
 
-import toml
 from netCDF4 import Dataset
-from pydantic import BaseModel, Field, model_validator
+from pydantic import (
+    BaseModel,
+    BeforeValidator,
+    ConfigDict,
+    Field,
+    PrivateAttr,
+    TypeAdapter,
+    field_validator,
+    model_validator,
+)
+from pydantic.dataclasses import dataclass
 
 from compliance_checker.base import BaseCheck, TestCtx
-from plugins.wcrp_base import WCRPBaseCheck
-from checks.attribute_checks.check_attribute_suite import check_attribute_suite
+from plugins.wcrp_base import WCRPBaseCheck, load_config_toml, load_toml
+from checks.attribute_checks.check_attribute_suite import (
+    check_attribute_suite,
+    check_attribute_suite_batch,
+)
 from checks.variable_checks.check_variable_existence import check_variable_existence
 from checks.variable_checks.check_variable_type import check_variable_type
 from checks.dimension_checks.check_dimension_existence import check_dimension_existence
-from checks.dimension_checks.check_dimension_positive import check_dimension_positive
+from checks.dimension_checks.check_dimension_triad import check_dimension_triad
 from checks.dimension_checks.check_dimension_size import (
     check_dimension_size_is_equals_to,
 )
@@ -100,7 +128,13 @@ from checks.coordinate_checks.check_fill_value_equals import (
     check_vertices_latitude_missing_value, check_vertices_latitude_fill_value,
     check_vertices_longitude_missing_value, check_vertices_longitude_fill_value,
 )
-from checks.utils import detect_grid_type, get_cmor_coordinate_info
+from checks.utils import (
+    detect_grid_type,
+    enable_read_cache,
+    fuzzy_match_dim,
+    get_attributes,
+    get_cmor_coordinate_info,
+)
 from checks.coordinate_checks.check_var_attributes import (
     # Height
     check_height_axis_exists, check_height_axis_type, check_height_axis_utf8, check_height_axis_value,
@@ -135,6 +169,8 @@ from checks.coordinate_checks.check_var_attributes import (
     check_vertices_longitude_units_utf8, check_vertices_longitude_units_value,
     check_vertices_longitude_missing_value_exists, check_vertices_longitude_missing_value_type,
     check_vertices_longitude_fillvalue_exists, check_vertices_longitude_fillvalue_type,
+    # Batched UTF-8 validation
+    UTF8_ATTRIBUTES, validate_attrs_utf8,
 )
 
 
@@ -166,127 +202,595 @@ except Exception:
 # Pydantic models
 # =============================================================================
 
-Severity = Literal["H", "M", "L"]
-ValueType = Literal["str", "int", "float", "str_array"]
+class SeverityLevel(IntEnum):
+    """Config severities, valued as the matching BaseCheck constants."""
+
+    H = BaseCheck.HIGH
+    M = BaseCheck.MEDIUM
+    L = BaseCheck.LOW
+
+
+class ValueKind(IntEnum):
+    STR = 0
+    INT = 1
+    FLOAT = 2
+    STR_ARRAY = 3
+
+    @property
+    def label(self) -> str:
+        """Name as written in the config and expected by check_attribute_suite."""
+        return self.name.lower()
+
+
+def _enum_from_name(enum_cls):
+    """Map the config string (e.g. "H", "str_array") to the enum member once."""
+
+    def _convert(value):
+        if isinstance(value, str):
+            try:
+                return enum_cls[value.upper()]
+            except KeyError:
+                raise ValueError(
+                    f"Invalid value '{value}', expected one of "
+                    f"{[m.name for m in enum_cls]}"
+                ) from None
+        return value
+
+    return _convert
+
+
+Severity = Annotated[SeverityLevel, BeforeValidator(_enum_from_name(SeverityLevel))]
+ValueType = Annotated[ValueKind, BeforeValidator(_enum_from_name(ValueKind))]
 GridType = Literal["regular", "curvilinear", "rotated", "all"]
 
 
-class SimpleCheck(BaseModel):
+@dataclass(frozen=True, slots=True)
+class SimpleCheck:
     severity: Severity
-    grid_type: Optional[List[GridType]] = None
+    grid_type: List[GridType] | None = None
 
 
-class AttributeRule(BaseModel):
+@dataclass(frozen=True, slots=True)
+class AttributeRule:
     severity: Severity
     value_type: ValueType
     is_required: bool = True
-    attribute_name: Optional[str] = None
-    constraint: Optional[str] = None
-    cv_source_collection: Optional[str] = None
-    cv_source_collection_key: Optional[str] = None
+    attribute_name: str | None = None
+    # Compiled once when the config is loaded
+    constraint: re.Pattern[str] | None = None
+    cv_source_collection: str | None = None
+    cv_source_collection_key: str | None = None
 
     @model_validator(mode="after")
     def _exclusive_rules(self):
-        if self.constraint and self.cv_source_collection:
+        if self.constraint is not None and self.constraint.pattern and self.cv_source_collection:
             raise ValueError(
                 "constraint and cv_source_collection are mutually exclusive"
             )
         return self
 
 
-class FileFormatRule(BaseModel):
+@dataclass(frozen=True, slots=True)
+class FileFormatRule:
     severity: Severity
     expected_format: str
     expected_data_model: str
 
 
-class FileCompressionRule(BaseModel):
+@dataclass(frozen=True, slots=True)
+class FileCompressionRule:
     severity: Severity
     expected_complevel: int
     expected_shuffle: bool
 
 
 class FileChecks(BaseModel):
-    format: Optional[FileFormatRule] = None
-    compression: Optional[FileCompressionRule] = None
+    format: FileFormatRule | None = None
+    compression: FileCompressionRule | None = None
 
 
 class DrsChecks(BaseModel):
-    filename: Optional[SimpleCheck] = None
-    directory: Optional[SimpleCheck] = None
-    attributes_vs_directory: Optional[SimpleCheck] = None
-    filename_vs_directory: Optional[SimpleCheck] = None
+    filename: SimpleCheck | None = None
+    directory: SimpleCheck | None = None
+    attributes_vs_directory: SimpleCheck | None = None
+    filename_vs_directory: SimpleCheck | None = None
+
+
+class Calendar(str, Enum):
+    """CF calendars accepted for the time-squareness calendar policy."""
 
+    STANDARD = "standard"
+    GREGORIAN = "gregorian"
+    PROLEPTIC_GREGORIAN = "proleptic_gregorian"
+    JULIAN = "julian"
+    NOLEAP = "noleap"
+    DAY_365 = "365_day"
+    ALL_LEAP = "all_leap"
+    DAY_366 = "366_day"
+    DAY_360 = "360_day"
+    NONE = "none"
 
-class TimeSquarenessRule(BaseModel):
+    def __str__(self):
+        return self.value
+
+
+@dataclass(frozen=True, slots=True)
+class TimeSquarenessRule:
     severity: Severity
-    calendar: str = ""
+    calendar: Calendar | None = None
     ref_time_units: str = ""
-    frequency: Dict[str, str] = Field(default_factory=dict)
+    frequency: Dict[str, str] = Field(default_factory=dict, validate_default=True)
+
+    @field_validator("calendar", mode="before")
+    @classmethod
+    def _normalize_calendar(cls, value):
+        # An empty calendar in the config means "do not check the calendar"
+        if isinstance(value, str):
+            return value.strip().lower() or None
+        return value
+
+    @field_validator("ref_time_units")
+    @classmethod
+    def _intern_ref_time_units(cls, value):
+        return sys.intern(value)
+
+    @field_validator("frequency")
+    @classmethod
+    def _freeze_frequency(cls, value):
+        # Only looked up by frequency id, so keep the hashed mapping, read-only
+        return MappingProxyType({sys.intern(k): v for k, v in value.items()})
 
 
 class TimeSection(BaseModel):
-    squareness: Optional[TimeSquarenessRule] = None
+    squareness: TimeSquarenessRule | None = None
 
 
 class ConsistencyChecks(BaseModel):
-    variant_label: Optional[SimpleCheck] = None
-    filename_vs_attributes: Optional[SimpleCheck] = None
-    experiment_details: Optional[SimpleCheck] = None
-    institution_details: Optional[SimpleCheck] = None
-    source_details: Optional[SimpleCheck] = None
-    freq_tableid: Optional[SimpleCheck] = None
+    variant_label: SimpleCheck | None = None
+    filename_vs_attributes: SimpleCheck | None = None
+    experiment_details: SimpleCheck | None = None
+    institution_details: SimpleCheck | None = None
+    source_details: SimpleCheck | None = None
+    freq_tableid: SimpleCheck | None = None
 
 
 class VariableAttributesSection(BaseModel):
-    severity: Optional[Severity] = None
-    items: Dict[str, SimpleCheck] = Field(default_factory=dict)
+    """Optional section-wide severity; every other key is a per-attribute check."""
 
-    @model_validator(mode="before")
-    @classmethod
-    def _split_severity_and_items(cls, values):
-        if values is None or not isinstance(values, dict):
-            return values
-        sev = values.get("severity")
-        items = {k: v for k, v in values.items() if k != "severity"}
-        return {"severity": sev, "items": items}
+    model_config = ConfigDict(extra="allow")
+
+    severity: Severity | None = None
+    __pydantic_extra__: Dict[str, SimpleCheck] = Field(init=False)
+
+    _names: Tuple[str, ...] = PrivateAttr(default=())
+    _severities: Tuple[int, ...] = PrivateAttr(default=())
+
+    @model_validator(mode="after")
+    def _index_items(self):
+        # Attribute names and their resolved BaseCheck severities, in config order
+        self._names = tuple(sys.intern(k) for k in self.__pydantic_extra__)
+        self._severities = tuple(
+            int(check.severity) for check in self.__pydantic_extra__.values()
+        )
+        return self
+
+    @property
+    def items(self) -> Dict[str, SimpleCheck]:
+        return self.__pydantic_extra__
+
+    @property
+    def names(self) -> Tuple[str, ...]:
+        return self._names
+
+    @property
+    def severities(self) -> Tuple[int, ...]:
+        return self._severities
 
 
 class VariableSection(BaseModel):
-    existence: Optional[SimpleCheck] = None
-    type: Optional[SimpleCheck] = None
-    dimensions: Optional[SimpleCheck] = None
-    attributes: Optional[VariableAttributesSection] = None
-    shape_bounds: Optional[SimpleCheck] = None
-    bnds_vertices: Optional[SimpleCheck] = None
-    time_checks: Optional[SimpleCheck] = None
+    existence: SimpleCheck | None = None
+    type: SimpleCheck | None = None
+    dimensions: SimpleCheck | None = None
+    attributes: VariableAttributesSection | None = None
+    shape_bounds: SimpleCheck | None = None
+    bnds_vertices: SimpleCheck | None = None
+    time_checks: SimpleCheck | None = None
 
 
 class CoordinatesSection(BaseModel):
-    auxiliary: Optional[SimpleCheck] = None
-    bounds: Optional[SimpleCheck] = None
-    properties: Optional[SimpleCheck] = None
-    time: Optional[TimeSection] = None
+    auxiliary: SimpleCheck | None = None
+    bounds: SimpleCheck | None = None
+    properties: SimpleCheck | None = None
+    time: TimeSection | None = None
+
+
+# Config nodes consulted by the Cmip6ProjectCheck check methods, by dotted path
+_CHECK_RULE_PATHS = (
+    "file.format",
+    "file.compression",
+    "drs.filename",
+    "drs.directory",
+    "drs.attributes_vs_directory",
+    "drs.filename_vs_directory",
+    "variable.existence",
+    "variable.type",
+    "variable.dimensions",
+    "variable.attributes",
+    "variable.shape_bounds",
+    "variable.bnds_vertices",
+    "variable.time_checks",
+    "coordinates.auxiliary",
+    "coordinates.bounds",
+    "coordinates.properties",
+    "coordinates.time.squareness",
+    "consistency_checks.filename_vs_attributes",
+    "consistency_checks.freq_tableid",
+    "consistency_checks.experiment_details",
+    "consistency_checks.variant_label",
+    "consistency_checks.institution_details",
+    "consistency_checks.source_details",
+)
+
+
+# Severity and grid types of a [variable_checks] entry, resolved on load
+ResolvedCheck = Tuple[int, List[GridType] | None]
 
 
 class CMIP6Config(BaseModel):
     project_name: str
     project_version: str
-    drs: Optional[DrsChecks] = None
-    file: Optional[FileChecks] = None
+    drs: DrsChecks | None = None
+    file: FileChecks | None = None
     global_attributes: Dict[str, AttributeRule] = Field(default_factory=dict)
-    variable_attributes: Optional[Dict[str, Dict[str, AttributeRule]]] = None
-    variable: Optional[VariableSection] = None
-    variable_checks: Optional[Dict[str, SimpleCheck]] = None
-    coordinates: Optional[CoordinatesSection] = None
-    consistency_checks: Optional[ConsistencyChecks] = None
-    frequency_table_id_mapping: Optional[Dict[str, List[str]]] = None
+    variable_attributes: Dict[str, Dict[str, AttributeRule]] | None = None
+    variable: VariableSection | None = None
+    variable_checks: Dict[str, SimpleCheck] | None = None
+    coordinates: CoordinatesSection | None = None
+    consistency_checks: ConsistencyChecks | None = None
+    frequency_table_id_mapping: Dict[str, FrozenSet[str]] | None = None
+
+    _attribute_suite_args: Tuple[Mapping[str, Any], ...] = PrivateAttr(default=())
+    _enabled_rules: Mapping[str, Any] = PrivateAttr(default_factory=dict)
+    _enabled_severities: Mapping[str, int] = PrivateAttr(default_factory=dict)
+    _resolved_variable_checks: Mapping[str, ResolvedCheck] = PrivateAttr(default_factory=dict)
+
+    @model_validator(mode="after")
+    def _prepare_attribute_rules(self):
+        # Attribute names recur in every checked file: intern them once and
+        # hand out read-only views of the rule mappings.
+        self.global_attributes = MappingProxyType(
+            {sys.intern(k): r for k, r in self.global_attributes.items()}
+        )
+        if self.variable_attributes is not None:
+            # Variables with identical rule sets share one mapping
+            pool = {}
+            shared = {}
+            for v, rules in self.variable_attributes.items():
+                key = frozenset(rules.items())
+                if key not in pool:
+                    pool[key] = MappingProxyType(
+                        {sys.intern(k): r for k, r in rules.items()}
+                    )
+                shared[sys.intern(v)] = pool[key]
+            self.variable_attributes = MappingProxyType(shared)
+
+        # Resolve the check_attribute_suite arguments of every rule once
+        rules = [(None, k, r) for k, r in self.global_attributes.items()]
+        for v, attrs in (self.variable_attributes or {}).items():
+            rules.extend((v, k, r) for k, r in attrs.items())
+        self._attribute_suite_args = tuple(
+            MappingProxyType(
+                {
+                    "attribute_name": k,
+                    "attribute_nc_name": r.attribute_name,
+                    "severity": int(r.severity),
+                    "value_type": r.value_type.label,
+                    "is_required": r.is_required,
+                    "constraint": r.constraint,
+                    "cv_collection": r.cv_source_collection,
+                    "cv_collection_key": r.cv_source_collection_key,
+                    "var_name": v,
+                }
+            )
+            for v, k, r in rules
+        )
+        return self
+
+    @model_validator(mode="after")
+    def _resolve_enabled_rules(self):
+        # Walk each check's config path once; a missing node disables the check
+        enabled = {}
+        for path in _CHECK_RULE_PATHS:
+            node = self
+            for part in path.split("."):
+                node = getattr(node, part)
+                if not node:
+                    break
+            else:
+                enabled[path] = node
+        self._enabled_rules = MappingProxyType(enabled)
+        self._enabled_severities = MappingProxyType(
+            {
+                path: int(node.severity)
+                for path, node in enabled.items()
+                if getattr(node, "severity", None) is not None
+            }
+        )
+
+        # (severity, grid types) of every [variable_checks] entry
+        self._resolved_variable_checks = MappingProxyType(
+            {
+                sys.intern(k): (int(c.severity), c.grid_type)
+                for k, c in (self.variable_checks or {}).items()
+            }
+        )
+        return self
 
+    @property
+    def attribute_suite_args(self) -> Tuple[Mapping[str, Any], ...]:
+        """check_attribute_suite keyword arguments for all global and variable attribute rules."""
+        return self._attribute_suite_args
+
+    @property
+    def enabled_rules(self) -> Mapping[str, Any]:
+        """Config node of every enabled check, keyed by its dotted path."""
+        return self._enabled_rules
+
+    @property
+    def enabled_severities(self) -> Mapping[str, int]:
+        """BaseCheck severity of every enabled check that has one, keyed by its dotted path."""
+        return self._enabled_severities
+
+    @property
+    def resolved_variable_checks(self) -> Mapping[str, ResolvedCheck]:
+        """(severity, grid types) of every enabled [variable_checks] entry."""
+        return self._resolved_variable_checks
+
+
+# Built once at import time and reused for every config load.
+_CMIP6_CONFIG_ADAPTER = TypeAdapter(CMIP6Config)
+
+
+def load_config(data: Dict[str, Any]) -> CMIP6Config:
+    """Validate a parsed configuration dict into a CMIP6Config."""
+    return _CMIP6_CONFIG_ADAPTER.validate_python(data)
+
+
+# Variable Registry fields needed by the variable checks
+_VR_TERM_FIELDS = (
+    "cf_standard_name",
+    "cf_units",
+    "dimensions",
+    "cell_methods",
+    "cell_measures",
+    "description",
+    "long_name",
+)
+
+
+@lru_cache(maxsize=4096)
+def _find_branded_variable(branded: str):
+    """
+    Look up a branded variable in the Variable Registry. Results are cached
+    per process, since the same branded variable recurs across many files;
+    failed queries raise and are not cached.
+    """
+    terms = find_terms_in_data_descriptor(
+        expression=branded,
+        data_descriptor_id="known_branded_variable",
+        only_id=True,
+        selected_term_fields=list(_VR_TERM_FIELDS),
+    )
+    return terms[0] if terms else None
+
+
+@lru_cache(maxsize=4096)
+def _literal_pattern(value: str) -> re.Pattern[str]:
+    """Compiled pattern matching exactly the given Variable Registry value."""
+    return re.compile(re.escape(value))
+
+
+# =============================================================================
+# Coordinate check tables
+# =============================================================================
+
+class CoordCheck(NamedTuple):
+    """One coordinate check run by the coordinate dispatchers of Cmip6ProjectCheck."""
+
+    key: str  # name under [variable_checks] in the config
+    fn: Callable[..., List[Any]]
+    requires: str | None  # attribute that must exist for the check to run
+    reports: str | None  # attribute whose absence this existence check reports
+    utf8: bool  # the check takes the batched UTF-8 status
+
+
+def _coord_check(fn, requires=None, reports=None, utf8=False, key=None) -> CoordCheck:
+    return CoordCheck(key or fn.__name__, fn, requires, reports, utf8)
+
+
+# Coordinate variables whose presence _detect_grid_type records
+_DETECTED_COORDS = (
+    "lat", "lon", "lat_bnds", "lon_bnds", "rlat", "rlon", "i", "j",
+    "vertices_latitude", "vertices_longitude", "height",
+)
+
+# Regular grid: lat, lon, lat_bnds, lon_bnds
+_REGULAR_COORD_CHECKS = (
+    ("lat", (
+        _coord_check(check_lat_exists),
+        _coord_check(check_lat_type),
+        _coord_check(check_lat_shape),
+        _coord_check(check_lat_no_nan_inf),
+        _coord_check(check_lat_value_range),
+        _coord_check(check_lat_values_within_bounds, key="check_lat_within_bounds"),
+        _coord_check(check_lat_data_within_actual_range),
+        _coord_check(check_lat_axis_type),
+        _coord_check(check_lat_axis_utf8, utf8=True),
+        _coord_check(check_lat_axis_value),
+        _coord_check(check_lat_units_type),
+        _coord_check(check_lat_units_utf8, utf8=True),
+        _coord_check(check_lat_long_name_exists, reports="long_name"),
+        _coord_check(check_lat_long_name_type, requires="long_name"),
+        _coord_check(check_lat_long_name_utf8, requires="long_name", utf8=True),
+        _coord_check(check_lat_long_name_value, requires="long_name"),
+        _coord_check(check_lat_bounds_exists, reports="bounds"),
+        _coord_check(check_lat_bounds_type, requires="bounds"),
+        _coord_check(check_lat_bounds_utf8, requires="bounds", utf8=True),
+    )),
+    ("lon", (
+        _coord_check(check_lon_exists),
+        _coord_check(check_lon_type),
+        _coord_check(check_lon_shape),
+        _coord_check(check_lon_no_nan_inf),
+        _coord_check(check_lon_value_range),
+        _coord_check(check_lon_values_within_bounds, key="check_lon_within_bounds"),
+        _coord_check(check_lon_data_within_actual_range),
+        _coord_check(check_lon_axis_type),
+        _coord_check(check_lon_axis_utf8, utf8=True),
+        _coord_check(check_lon_axis_value),
+        _coord_check(check_lon_units_type),
+        _coord_check(check_lon_units_utf8, utf8=True),
+        _coord_check(check_lon_long_name_exists, reports="long_name"),
+        _coord_check(check_lon_long_name_type, requires="long_name"),
+        _coord_check(check_lon_long_name_utf8, requires="long_name", utf8=True),
+        _coord_check(check_lon_long_name_value, requires="long_name"),
+        _coord_check(check_lon_bounds_exists, reports="bounds"),
+        _coord_check(check_lon_bounds_type, requires="bounds"),
+        _coord_check(check_lon_bounds_utf8, requires="bounds", utf8=True),
+    )),
+    ("lat_bnds", (
+        _coord_check(check_lat_bnds_exists),
+        _coord_check(check_lat_bnds_type),
+        _coord_check(check_lat_bnds_shape),
+        _coord_check(check_lat_bnds_no_nan_inf),
+        _coord_check(check_lat_bnds_value_range),
+        _coord_check(check_lat_bnds_monotonicity),
+        _coord_check(check_lat_bnds_contiguity),
+    )),
+    ("lon_bnds", (
+        _coord_check(check_lon_bnds_exists),
+        _coord_check(check_lon_bnds_type),
+        _coord_check(check_lon_bnds_shape),
+        _coord_check(check_lon_bnds_no_nan_inf),
+        _coord_check(check_lon_bnds_value_range),
+        _coord_check(check_lon_bnds_monotonicity),
+        _coord_check(check_lon_bnds_contiguity),
+    )),
+)
+
+
+# Curvilinear grid: i, j, vertices_latitude, vertices_longitude
+_CURVILINEAR_COORD_CHECKS = (
+    ("i", (
+        _coord_check(check_i_exists),
+        _coord_check(check_i_type),
+        _coord_check(check_i_shape),
+        _coord_check(check_i_no_nan_inf),
+        _coord_check(check_i_strictly_positive),
+        _coord_check(check_i_units_exists, reports="units"),
+        _coord_check(check_i_units_type, requires="units"),
+        _coord_check(check_i_units_utf8, requires="units", utf8=True),
+        _coord_check(check_i_units_value, requires="units"),
+        _coord_check(check_i_long_name_exists, reports="long_name"),
+        _coord_check(check_i_long_name_type, requires="long_name"),
+        _coord_check(check_i_long_name_utf8, requires="long_name", utf8=True),
+        _coord_check(check_i_long_name_value, requires="long_name"),
+    )),
+    ("j", (
+        _coord_check(check_j_exists),
+        _coord_check(check_j_type),
+        _coord_check(check_j_shape),
+        _coord_check(check_j_no_nan_inf),
+        _coord_check(check_j_strictly_positive),
+        _coord_check(check_j_units_exists, reports="units"),
+        _coord_check(check_j_units_type, requires="units"),
+        _coord_check(check_j_units_utf8, requires="units", utf8=True),
+        _coord_check(check_j_units_value, requires="units"),
+        _coord_check(check_j_long_name_exists, reports="long_name"),
+        _coord_check(check_j_long_name_type, requires="long_name"),
+        _coord_check(check_j_long_name_utf8, requires="long_name", utf8=True),
+        _coord_check(check_j_long_name_value, requires="long_name"),
+    )),
+    ("vertices_latitude", (
+        _coord_check(check_vertices_latitude_exists),
+        _coord_check(check_vertices_latitude_type),
+        _coord_check(check_vertices_latitude_shape),
+        _coord_check(check_vertices_latitude_no_nan_inf),
+        _coord_check(check_vertices_latitude_value_range),
+        _coord_check(check_vertices_latitude_missing_value),
+        _coord_check(check_vertices_latitude_fill_value),
+        _coord_check(check_vertices_latitude_units_exists, reports="units"),
+        _coord_check(check_vertices_latitude_units_type, requires="units"),
+        _coord_check(check_vertices_latitude_units_utf8, requires="units", utf8=True),
+        _coord_check(check_vertices_latitude_units_value, requires="units"),
+        _coord_check(check_vertices_latitude_missing_value_exists, reports="missing_value"),
+        _coord_check(
+            check_vertices_latitude_missing_value_type, requires="missing_value"
+        ),
+        _coord_check(check_vertices_latitude_fillvalue_exists, reports="_FillValue"),
+        _coord_check(check_vertices_latitude_fillvalue_type, requires="_FillValue"),
+    )),
+    ("vertices_longitude", (
+        _coord_check(check_vertices_longitude_exists),
+        _coord_check(check_vertices_longitude_type),
+        _coord_check(check_vertices_longitude_shape),
+        _coord_check(check_vertices_longitude_no_nan_inf),
+        _coord_check(check_vertices_longitude_value_range),
+        _coord_check(check_vertices_longitude_missing_value),
+        _coord_check(check_vertices_longitude_fill_value),
+        _coord_check(check_vertices_longitude_units_exists, reports="units"),
+        _coord_check(check_vertices_longitude_units_type, requires="units"),
+        _coord_check(check_vertices_longitude_units_utf8, requires="units", utf8=True),
+        _coord_check(check_vertices_longitude_units_value, requires="units"),
+        _coord_check(check_vertices_longitude_missing_value_exists, reports="missing_value"),
+        _coord_check(
+            check_vertices_longitude_missing_value_type, requires="missing_value"
+        ),
+        _coord_check(check_vertices_longitude_fillvalue_exists, reports="_FillValue"),
+        _coord_check(check_vertices_longitude_fillvalue_type, requires="_FillValue"),
+    )),
+)
+
+
+# Vertical coordinates: height
+_VERTICAL_COORD_CHECKS = (
+    ("height", (
+        _coord_check(check_height_exists),
+        _coord_check(check_height_type),
+        _coord_check(check_height_strictly_positive),
+        _coord_check(check_height_axis_exists, reports="axis"),
+        _coord_check(check_height_axis_type, requires="axis"),
+        _coord_check(check_height_axis_utf8, requires="axis", utf8=True),
+        _coord_check(check_height_axis_value, requires="axis"),
+        _coord_check(check_height_standard_name_type),
+        _coord_check(check_height_standard_name_utf8, utf8=True),
+        _coord_check(check_height_standard_name_value),
+        _coord_check(check_height_long_name_exists, reports="long_name"),
+        _coord_check(check_height_long_name_type, requires="long_name"),
+        _coord_check(check_height_long_name_utf8, requires="long_name", utf8=True),
+        _coord_check(check_height_long_name_value, requires="long_name"),
+        _coord_check(check_height_units_type),
+        _coord_check(check_height_units_utf8, utf8=True),
+        _coord_check(check_height_positive_type),
+        _coord_check(check_height_positive_utf8, utf8=True),
+    )),
+)
 
 # =============================================================================
 # CMIP6 Project Checker
 # =============================================================================
 
+_THIS_DIR = os.path.dirname(os.path.abspath(__file__))
+_DEFAULT_CONFIG_PATH = os.path.join(_THIS_DIR, "resources", "wcrp_config.toml")
+_PLUGIN_MAPPING_PATH = os.path.join(_THIS_DIR, "mapping_variables.toml")
+
+# dtype kinds accepted by check_variable_type
+_FLOAT_KINDS = ("f",)
+_NUMERIC_KINDS = ("f", "i")
+
+# Expected sizes of the bounds and vertices dimensions
+_BOUNDS_DIM_SIZES = {"bnds": 2, "axis_nbounds": 2, "vertices": 4, "nv4": 4}
+
 
 class Cmip6ProjectCheck(WCRPBaseCheck):
     _cc_spec = "wcrp_cmip6"
@@ -297,20 +801,24 @@ class Cmip6ProjectCheck(WCRPBaseCheck):
     def __init__(self, options=None):
         super().__init__(options)
         self.project_name = "cmip6"
-        self.config: Optional[CMIP6Config] = None
-        self._geo_var_cache = None
-        self._vr_expected_cache = None
-        self._vr_expected_dims_cache = None
-        self._grid_type_cache = None
-        self._detected_coords_cache = None
+        self.config: CMIP6Config | None = None
+        self._rules: Mapping[str, Any] = {}
+        self._sevs: Mapping[str, int] = {}
+        self._vchecks: Mapping[str, ResolvedCheck] = {}
+        self._active_checks = {}
+        self._geo_var_state = None
+        self._vr_state = None
+        self._grid_type_cache = {}
+        self._utf8_cache = {}
+        self._var_names = frozenset()
+        self._dim_names = frozenset()
+        self._global_attrs = {}
+        self._coord_tokens = {}
 
         if options and "project_config_path" in options:
             self.project_config_path = options["project_config_path"]
         else:
-            this_dir = os.path.dirname(os.path.abspath(__file__))
-            self.project_config_path = os.path.join(
-                this_dir, "resources", "wcrp_config.toml"
-            )
+            self.project_config_path = _DEFAULT_CONFIG_PATH
 
     def setup(self, ds):
         super().setup(ds)
@@ -318,21 +826,44 @@ class Cmip6ProjectCheck(WCRPBaseCheck):
         self._load_mapping()
         if self.consistency_output:
             self._write_consistency_output()
-        self._geo_var_cache = None
-        self._vr_expected_cache = None
-        self._vr_expected_dims_cache = None
-        self._grid_type_cache = None
-        self._detected_coords_cache = None
+        self._geo_var_state = None
+        self._vr_state = None
+        self._grid_type_cache = {}
+        self._utf8_cache = {}
+        # Checks share the decoded arrays and attributes of this dataset
+        enable_read_cache(ds)
+        self._snapshot_dataset(ds)
+
+    def _snapshot_dataset(self, ds):
+        """
+        Read variable and dimension names and the global attributes once
+        per dataset, so the checks below consult plain dicts instead of going
+        back to the NetCDF layer on every access. Variable attributes are
+        read through the shared get_attributes snapshot.
+        """
+        self._var_names = frozenset(ds.variables)
+        self._dim_names = frozenset(ds.dimensions)
+        self._global_attrs = {k: ds.getncattr(k) for k in ds.ncattrs()}
+        # coordinates attributes, split into names once
+        self._coord_tokens = {}
+        for v in ds.variables:
+            coordinates = get_attributes(ds, v).get("coordinates")
+            if coordinates is not None:
+                self._coord_tokens[v] = tuple(str(coordinates).split())
 
     def _load_project_config(self):
         if not os.path.exists(self.project_config_path):
             raise RuntimeError(f"Config not found: {self.project_config_path}")
-        with open(self.project_config_path, "r", encoding="utf-8") as f:
-            self.config = CMIP6Config(**toml.load(f))
+        config = load_config_toml(self.project_config_path, load_config)
+        self.config = config
+        self._rules = config.enabled_rules
+        self._sevs = config.enabled_severities
+        if self._vchecks is not config.resolved_variable_checks:
+            self._vchecks = config.resolved_variable_checks
+            self._active_checks = {}
 
     def _load_mapping(self):
-        root_dir = os.path.dirname(os.path.abspath(__file__))
-        path_root = os.path.join(root_dir, "mapping_variables.toml")
+        path_root = _PLUGIN_MAPPING_PATH
         config_dir = os.path.dirname(self.project_config_path)
         path_resources = os.path.join(config_dir, "mapping_variables.toml")
 
@@ -344,128 +875,104 @@ class Cmip6ProjectCheck(WCRPBaseCheck):
 
         if not path_to_use:
             print(
-                f"WARNING: mapping_variables.toml not found in {root_dir} or {config_dir}"
+                f"WARNING: mapping_variables.toml not found in {_THIS_DIR} or {config_dir}"
             )
             self.variable_mapping = {}
+            self._mapping_by_tuple = {}
             return
 
         try:
-            with open(path_to_use, "r", encoding="utf-8") as f:
-                data = toml.load(f)
-                self.variable_mapping = data.get("mapping_variables", {})
-                if not self.variable_mapping:
-                    print(
-                        f"WARNING: File {path_to_use} loaded but [mapping_variables] section is empty."
-                    )
+            self.variable_mapping = load_toml(path_to_use).get("mapping_variables", {})
+            # "<table_id>.<variable_id>" keys, looked up as (table_id, variable_id)
+            self._mapping_by_tuple = {}
+            for mapping_key, branded in self.variable_mapping.items():
+                table_id, _, variable_id = mapping_key.partition(".")
+                self._mapping_by_tuple[(table_id, variable_id)] = branded
+            if not self.variable_mapping:
+                print(
+                    f"WARNING: File {path_to_use} loaded but [mapping_variables] section is empty."
+                )
         except Exception as e:
             print(f"CRITICAL ERROR loading mapping {path_to_use}: {e}")
             self.variable_mapping = {}
+            self._mapping_by_tuple = {}
 
     # --- Helpers ---
-    def _get_geo_var(self, ds, severity) -> Tuple[Optional[str], List[Any]]:
-        if self._geo_var_cache and self._geo_var_cache in ds.variables:
-            return self._geo_var_cache, []
-        results = []
+    def _get_geo_var(self, ds, severity) -> Tuple[str | None, List[Any]]:
+        if self._geo_var_state is None:
+            self._geo_var_state = self._find_geo_var(ds)
+        geo, error = self._geo_var_state
+        if error is None:
+            return geo, []
+        ctx = TestCtx(severity, "Geophysical Variable Detection")
+        ctx.add_failure(error)
+        return None, [ctx.to_result()]
+
+    def _find_geo_var(self, ds) -> Tuple[str | None, str | None]:
+        """Detect the single geophysical variable, or describe why it failed."""
         try:
             geo_vars = list(get_geophysical_variables(ds))
         except Exception as e:
-            ctx = TestCtx(severity, "Geophysical Variable Detection")
-            ctx.add_failure(f"Error detecting variables: {e}")
-            results.append(ctx.to_result())
-            return None, results
+            return None, f"Error detecting variables: {e}"
 
         if len(geo_vars) != 1:
-            ctx = TestCtx(severity, "Geophysical Variable Detection")
-            ctx.add_failure(
-                f"Expected exactly 1 geophysical variable, found {len(geo_vars)}: {geo_vars}"
+            return (
+                None,
+                f"Expected exactly 1 geophysical variable, found {len(geo_vars)}: {geo_vars}",
             )
-            results.append(ctx.to_result())
-            return None, results
-
-        self._geo_var_cache = geo_vars[0]
-        return self._geo_var_cache, results
+        return geo_vars[0], None
 
     def _get_expected_from_registry(self, ds, severity):
-        if self._vr_expected_cache is not None:
-            return self._vr_expected_cache, self._vr_expected_dims_cache, []
-
-        results = []
-
+        if self._vr_state is None:
+            self._vr_state = self._lookup_registry()
+        expected, expected_dims, error = self._vr_state
+        if error is None:
+            return expected, expected_dims, []
+        ctx = TestCtx(severity, "Variable Registry")
+        ctx.add_failure(error)
+        return None, None, [ctx.to_result()]
+
+    def _lookup_registry(self):
+        """
+        Resolve the Variable Registry entry of the file's branded variable.
+        Returns (expected, expected_dims, error); error is None unless the
+        lookup failed in a way the checks should report.
+        """
         if not ESG_VOCAB_AVAILABLE or find_terms_in_data_descriptor is None:
-            return None, None, results
-
-        try:
-            variable_id = ds.getncattr("variable_id")
-            table_id = ds.getncattr("table_id")
-        except Exception as e:
-            ctx = TestCtx(severity, "Variable Registry")
-            ctx.add_failure(f"Missing required attributes for VR lookup: {e}")
-            results.append(ctx.to_result())
-            return None, None, results
+            return None, None, None
+
+        missing = [a for a in ("variable_id", "table_id") if a not in self._global_attrs]
+        if missing:
+            return (
+                None,
+                None,
+                f"Missing required attributes for VR lookup: {', '.join(missing)}",
+            )
+        variable_id = self._global_attrs["variable_id"]
+        table_id = self._global_attrs["table_id"]
 
-        mapping_key = f"{table_id}.{variable_id}"
-        branded = getattr(self, "variable_mapping", {}).get(mapping_key)
+        branded = getattr(self, "_mapping_by_tuple", {}).get((table_id, variable_id))
 
         if not branded:
-            ctx = TestCtx(severity, "Variable Registry")
-            ctx.add_failure(
-                f"No mapping found for '{mapping_key}' in mapping_variables.toml"
+            return (
+                None,
+                None,
+                f"No mapping found for '{table_id}.{variable_id}' in mapping_variables.toml",
             )
-            results.append(ctx.to_result())
-            return None, None, results
-
-        fields_to_get = [
-            "cf_standard_name",
-            "cf_units",
-            "dimensions",
-            "cell_methods",
-            "cell_measures",
-            "description",
-            "long_name",
-        ]
-
-        expected = None
+
         try:
-            terms = find_terms_in_data_descriptor(
-                expression=str(branded),
-                data_descriptor_id="known_branded_variable",
-                only_id=True,
-                selected_term_fields=fields_to_get,
-            )
-            if terms:
-                expected = terms[0]
+            expected = _find_branded_variable(str(branded))
         except Exception as e:
-            ctx = TestCtx(severity, "Variable Registry")
-            ctx.add_failure(f"Error querying ESGVOC (find_terms) for '{branded}': {e}")
-            results.append(ctx.to_result())
-            return None, None, results
+            return None, None, f"Error querying ESGVOC (find_terms) for '{branded}': {e}"
 
         if not expected:
-            ctx = TestCtx(severity, "Variable Registry")
-            ctx.add_failure(f"Term '{branded}' not found in Variable Registry.")
-            results.append(ctx.to_result())
-            return None, None, results
-
-        try:
-            expected_dims = getattr(expected, "dimensions", []) or []
-        except Exception:
-            expected_dims = []
-
-        self._vr_expected_cache = expected
-        self._vr_expected_dims_cache = expected_dims
+            return None, None, f"Term '{branded}' not found in Variable Registry."
 
-        return expected, expected_dims, results
+        expected_dims = getattr(expected, "dimensions", None) or []
 
-    @staticmethod
-    def _fuzzy_match_dim(expected, actuals):
-        if expected in actuals:
-            return expected
-        for a in actuals:
-            if a in expected or expected in a:
-                return a
-        return None
+        return expected, expected_dims, None
 
-    def _detect_grid_type(self, ds, severity) -> Tuple[Optional[str], Dict[str, bool], List[Any]]:
+    def _detect_grid_type(self, ds, severity) -> Tuple[str | None, Dict[str, bool], List[Any]]:
         """
         Detect grid type using operation-based inspection.
 
@@ -475,23 +982,20 @@ class Cmip6ProjectCheck(WCRPBaseCheck):
                    (i.e. rectangular + rlat/rlon present)
         - Curvilinear: 2-D lat/lon coordinates
         - Unstructured: cf_role='mesh_topology' present
+
+        The outcome (including an undetermined grid) is cached per dataset:
+        only the first caller receives the detection results, later callers
+        get an empty result list and go straight to their grid-type guard.
         """
-        if self._grid_type_cache is not None:
-            return self._grid_type_cache, self._detected_coords_cache, []
+        cached = self._grid_type_cache.get(id(ds))
+        if cached is not None:
+            return cached[0], cached[1], []
 
         results = []
-        variables = set(ds.variables.keys())
+        variables = self._var_names
 
         # Track which coordinates are present (used by downstream checks)
-        detected = {
-            "lat": "lat" in variables, "lon": "lon" in variables,
-            "lat_bnds": "lat_bnds" in variables, "lon_bnds": "lon_bnds" in variables,
-            "rlat": "rlat" in variables, "rlon": "rlon" in variables,
-            "i": "i" in variables, "j": "j" in variables,
-            "vertices_latitude": "vertices_latitude" in variables,
-            "vertices_longitude": "vertices_longitude" in variables,
-            "height": "height" in variables,
-        }
+        detected = {name: name in variables for name in _DETECTED_COORDS}
 
         # Use operation-based detection
         detection = detect_grid_type(self.xrds, ds)
@@ -525,48 +1029,110 @@ class Cmip6ProjectCheck(WCRPBaseCheck):
         else:
             print(f"[INFO] Detected grid type: {grid_type} ({detection.method})")
 
-        self._grid_type_cache = grid_type
-        self._detected_coords_cache = detected
+        self._grid_type_cache[id(ds)] = (grid_type, detected)
         return grid_type, detected, results
 
-    def _should_run_check(self, check_name: str, ds) -> Tuple[bool, int]:
-        """Check if a check should run based on config and grid type."""
-        if not self.config or not self.config.variable_checks:
-            return False, BaseCheck.HIGH
+    def _attr_names(self, ds, var_name):
+        """
+        Return the attribute names of a variable from the attributes
+        snapshot. Used to skip the type/UTF-8/value checks of attributes
+        already reported missing by their existence check.
+        """
+        if var_name not in self._var_names:
+            return ()
+        return get_attributes(ds, var_name).keys()
 
-        check_config = self.config.variable_checks.get(check_name)
-        if not check_config:
+    def _validate_attrs_utf8(self, ds, var_name):
+        """
+        Validate the UTF-8 encoding of all checked string attributes of a
+        coordinate variable in one pass. The result is cached per dataset.
+        """
+        if var_name not in self._utf8_cache:
+            self._utf8_cache[var_name] = validate_attrs_utf8(
+                ds, var_name, UTF8_ATTRIBUTES.get(var_name, ())
+            )
+        return self._utf8_cache[var_name]
+
+    def _should_run_check(self, check_name: str, grid_type: str | None) -> Tuple[bool, int]:
+        """Check if a check should run based on config and grid type."""
+        resolved = self._vchecks.get(check_name)
+        if resolved is None:
             return False, BaseCheck.HIGH
 
-        sev = self.get_severity(check_config.severity)
+        sev, grid_types = resolved
 
-        if not check_config.grid_type:
+        if not grid_types:
             return True, sev
 
-        if self._grid_type_cache is None:
-            self._detect_grid_type(ds, BaseCheck.HIGH)
-
-        if self._grid_type_cache is None:
+        if grid_type is None:
             return False, sev
 
-        if "all" in check_config.grid_type or self._grid_type_cache in check_config.grid_type:
+        if "all" in grid_types or grid_type in grid_types:
             return True, sev
 
         return False, sev
 
+    def _active_coord_checks(self, table, grid_type):
+        """
+        The entries of a coordinate check table enabled for grid_type, as
+        (var_name, ((CoordCheck, severity), ...)) pairs. Compiled once per
+        table and grid type for the loaded config.
+        """
+        key = (id(table), grid_type)
+        active = self._active_checks.get(key)
+        if active is None:
+            compiled = []
+            for var_name, checks in table:
+                enabled = []
+                for check in checks:
+                    run, sev = self._should_run_check(check.key, grid_type)
+                    if run:
+                        enabled.append((check, sev))
+                # A missing attribute is only skipped when its existence
+                # check runs and reports it
+                reported = {check.reports for check, _ in enabled if check.reports}
+                enabled = [
+                    (check, sev)
+                    if check.requires is None or check.requires in reported
+                    else (check._replace(requires=None), sev)
+                    for check, sev in enabled
+                ]
+                if enabled:
+                    compiled.append((var_name, tuple(enabled)))
+            active = self._active_checks[key] = tuple(compiled)
+        return active
+
+    def _iter_coord_checks(self, ds, var_name, checks):
+        """
+        Yield the results of the enabled checks of one coordinate variable,
+        in table order. Checks of an attribute are skipped when the attribute
+        is missing and its enabled existence check already reports it.
+        """
+        attrs = self._attr_names(ds, var_name)
+        utf8 = None
+        for check, sev in checks:
+            if check.requires is not None and check.requires not in attrs:
+                continue
+            if check.utf8:
+                if utf8 is None:
+                    utf8 = self._validate_attrs_utf8(ds, var_name)
+                yield from check.fn(ds, sev, utf8_status=utf8)
+            else:
+                yield from check.fn(ds, sev)
+
     # --- File Checks ---
     def check_File_Format(self, ds):
-        if not self.config or not self.config.file or not self.config.file.format:
+        r = self._rules.get("file.format")
+        if not r:
             return []
-        r = self.config.file.format
         return check_format(
             ds, r.expected_format, r.expected_data_model, self.get_severity(r.severity)
         )
 
     def check_File_Compression(self, ds):
-        if not self.config or not self.config.file or not self.config.file.compression:
+        r = self._rules.get("file.compression")
+        if not r:
             return []
-        r = self.config.file.compression
         return check_compression(
             ds,
             None,
@@ -577,23 +1143,12 @@ class Cmip6ProjectCheck(WCRPBaseCheck):
 
     def check_Drs_Vocabulary(self, ds):
         res = []
-        if self.config and self.config.drs:
-            if self.config.drs.filename:
-                res.extend(
-                    check_drs_filename(
-                        ds,
-                        self.get_severity(self.config.drs.filename.severity),
-                        self.project_name,
-                    )
-                )
-            if self.config.drs.directory:
-                res.extend(
-                    check_drs_directory(
-                        ds,
-                        self.get_severity(self.config.drs.directory.severity),
-                        self.project_name,
-                    )
-                )
+        sev = self._sevs.get("drs.filename")
+        if sev is not None:
+            res.extend(check_drs_filename(ds, sev, self.project_name))
+        sev = self._sevs.get("drs.directory")
+        if sev is not None:
+            res.extend(check_drs_directory(ds, sev, self.project_name))
         return res
 
     # --- Attribute Checks ---
@@ -602,53 +1157,19 @@ class Cmip6ProjectCheck(WCRPBaseCheck):
         if not self.config:
             return res
 
-        for k, r in self.config.global_attributes.items():
-            res.extend(
-                check_attribute_suite(
-                    ds=ds,
-                    attribute_name=k,
-                    attribute_nc_name=r.attribute_name,
-                    severity=self.get_severity(r.severity),
-                    value_type=r.value_type,
-                    is_required=r.is_required,
-                    constraint=r.constraint,
-                    cv_collection=r.cv_source_collection,
-                    cv_collection_key=r.cv_source_collection_key,
-                    var_name=None,
-                    project_name=self.project_name,
-                )
+        res.extend(
+            check_attribute_suite_batch(
+                ds, self.config.attribute_suite_args, project_name=self.project_name
             )
-
-        if self.config.variable_attributes:
-            for v, attrs in self.config.variable_attributes.items():
-                for k, r in attrs.items():
-                    res.extend(
-                        check_attribute_suite(
-                            ds=ds,
-                            attribute_name=k,
-                            attribute_nc_name=r.attribute_name,
-                            severity=self.get_severity(r.severity),
-                            value_type=r.value_type,
-                            is_required=r.is_required,
-                            constraint=r.constraint,
-                            cv_collection=r.cv_source_collection,
-                            cv_collection_key=r.cv_source_collection_key,
-                            var_name=v,
-                            project_name=self.project_name,
-                        )
-                    )
+        )
         return res
 
     # --- Variable Checks ---
     def check_variable_existence(self, ds):
         res = []
-        if (
-            not self.config
-            or not self.config.variable
-            or not self.config.variable.existence
-        ):
+        sev = self._sevs.get("variable.existence")
+        if sev is None:
             return res
-        sev = self.get_severity(self.config.variable.existence.severity)
         geo, r = self._get_geo_var(ds, sev)
         res.extend(r)
         if geo:
@@ -657,25 +1178,21 @@ class Cmip6ProjectCheck(WCRPBaseCheck):
 
     def check_variable_type(self, ds):
         res = []
-        if not self.config or not self.config.variable or not self.config.variable.type:
+        sev = self._sevs.get("variable.type")
+        if sev is None:
             return res
-        sev = self.get_severity(self.config.variable.type.severity)
         geo, r = self._get_geo_var(ds, sev)
         res.extend(r)
         if geo:
-            res.extend(check_variable_type(ds, geo, allowed_types=["f"], severity=sev))
+            res.extend(check_variable_type(ds, geo, allowed_types=_FLOAT_KINDS, severity=sev))
         return res
 
     def check_variable_dimensions(self, ds):
         res = []
-        if (
-            not self.config
-            or not self.config.variable
-            or not self.config.variable.dimensions
-        ):
+        sev = self._sevs.get("variable.dimensions")
+        if sev is None:
             return res
 
-        sev = self.get_severity(self.config.variable.dimensions.severity)
         geo, r = self._get_geo_var(ds, sev)
         res.extend(r)
         if not geo:
@@ -683,9 +1200,7 @@ class Cmip6ProjectCheck(WCRPBaseCheck):
 
         act = list(ds.variables[geo].dimensions)
         for d in act:
-            res.extend(check_dimension_existence(ds, d, sev))
-            res.extend(check_dimension_positive(ds, d, sev))
-            res.extend(check_variable_existence(ds, d, sev))
+            res.extend(check_dimension_triad(ds, d, sev))
 
         exp, exp_dims, vr_r = self._get_expected_from_registry(ds, sev)
         res.extend(vr_r)
@@ -703,13 +1218,14 @@ class Cmip6ProjectCheck(WCRPBaseCheck):
                 )
             res.append(ctx_len.to_result())
 
+            act_names = frozenset(act)
             for ed in exp_dims:
                 eds = str(ed)
-                if eds in {"bnds", "axis_nbounds", "vertices", "nv4"}:
+                if eds in _BOUNDS_DIM_SIZES:
                     continue
-                if self._fuzzy_match_dim(eds, act):
+                if fuzzy_match_dim(eds, act, act_names):
                     continue
-                if eds.lower().startswith("height") and "height" in ds.variables:
+                if eds.lower().startswith("height") and "height" in self._var_names:
                     continue
 
                 res.extend(check_dimension_existence(ds, eds, sev))
@@ -718,17 +1234,10 @@ class Cmip6ProjectCheck(WCRPBaseCheck):
 
     def check_variable_attributes_registry(self, ds):
         res = []
-        if (
-            not self.config
-            or not self.config.variable
-            or not self.config.variable.attributes
-        ):
+        attrs = self._rules.get("variable.attributes")
+        if not attrs:
             return res
-        d_sev = (
-            self.get_severity(self.config.variable.attributes.severity)
-            if self.config.variable.attributes.severity
-            else BaseCheck.HIGH
-        )
+        d_sev = self.get_severity(attrs.severity) if attrs.severity else BaseCheck.HIGH
         geo, r = self._get_geo_var(ds, d_sev)
         res.extend(r)
         if not geo:
@@ -747,8 +1256,7 @@ class Cmip6ProjectCheck(WCRPBaseCheck):
             "long_name": ("long_name", "long_name"),
         }
 
-        for k, item in self.config.variable.attributes.items.items():
-            sev = self.get_severity(item.severity) if item else d_sev
+        for k, sev in zip(attrs.names, attrs.severities):
             if k in mapping:
                 vr_f, nc_a = mapping[k]
                 val = getattr(exp, vr_f, None)
@@ -761,7 +1269,7 @@ class Cmip6ProjectCheck(WCRPBaseCheck):
                             severity=sev,
                             value_type="str",
                             is_required=True,
-                            constraint=re.escape(str(val).strip()),
+                            constraint=_literal_pattern(str(val).strip()),
                             cv_collection=None,
                             cv_collection_key=None,
                             var_name=geo,
@@ -772,8 +1280,8 @@ class Cmip6ProjectCheck(WCRPBaseCheck):
 
     def check_variable_bounds(self, ds):
         res = []
-        if self.config and self.config.variable and self.config.variable.shape_bounds:
-            sev = self.get_severity(self.config.variable.shape_bounds.severity)
+        sev = self._sevs.get("variable.shape_bounds")
+        if sev is not None:
             geo, r = self._get_geo_var(ds, sev)
             if geo:
                 res.extend(check_bounds_value_consistency(ds, geo, sev))
@@ -781,18 +1289,18 @@ class Cmip6ProjectCheck(WCRPBaseCheck):
 
     def check_variable_bnds_vertices(self, ds):
         res = []
-        if self.config and self.config.variable and self.config.variable.bnds_vertices:
-            sev = self.get_severity(self.config.variable.bnds_vertices.severity)
-            for d, s in [("bnds", 2), ("axis_nbounds", 2), ("vertices", 4), ("nv4", 4)]:
-                if d in ds.dimensions:
+        sev = self._sevs.get("variable.bnds_vertices")
+        if sev is not None:
+            for d, s in _BOUNDS_DIM_SIZES.items():
+                if d in self._dim_names:
                     res.extend(check_dimension_size_is_equals_to(ds, d, s, sev))
         return res
 
     def check_variable_time_checks(self, ds):
         res = []
-        if self.config and self.config.variable and self.config.variable.time_checks:
-            sev = self.get_severity(self.config.variable.time_checks.severity)
-            if "time" in ds.variables:
+        sev = self._sevs.get("variable.time_checks")
+        if sev is not None:
+            if "time" in self._var_names:
                 res.extend(check_time_range_vs_filename(ds, sev))
                 res.extend(check_time_bounds(ds, sev))
         return res
@@ -800,80 +1308,59 @@ class Cmip6ProjectCheck(WCRPBaseCheck):
     # --- Coordinates Checks ---
     def check_coordinates_auxiliary(self, ds):
         res = []
-        if (
-            not self.config
-            or not self.config.coordinates
-            or not self.config.coordinates.auxiliary
-        ):
+        sev = self._sevs.get("coordinates.auxiliary")
+        if sev is None:
             return res
-        sev = self.get_severity(self.config.coordinates.auxiliary.severity)
         geo, r = self._get_geo_var(ds, sev)
         res.extend(r)
         if geo:
-            try:
-                for n in str(ds.variables[geo].getncattr("coordinates")).split():
-                    res.extend(check_variable_existence(ds, n.strip(), sev))
-            except Exception:
-                pass
+            for n in self._coord_tokens.get(geo, ()):
+                res.extend(check_variable_existence(ds, n, sev))
         return res
 
     def check_coordinates_bounds(self, ds):
         res = []
-        if (
-            not self.config
-            or not self.config.coordinates
-            or not self.config.coordinates.bounds
-        ):
+        sev = self._sevs.get("coordinates.bounds")
+        if sev is None:
             return res
-        sev = self.get_severity(self.config.coordinates.bounds.severity)
         geo, r = self._get_geo_var(ds, sev)
         if not geo:
             return res
-        cand = set()
-        try:
-            cand.update(ds.variables[geo].dimensions)
-        except (AttributeError, KeyError):
-            pass
-        try:
-            cand.update(str(ds.variables[geo].getncattr("coordinates")).split())
-        except (AttributeError, KeyError):
-            pass
+        cand = set(ds.variables[geo].dimensions)
+        cand.update(self._coord_tokens.get(geo, ()))
         for c in cand:
-            if c in ds.variables and hasattr(ds.variables[c], "bounds"):
-                res.extend(check_variable_existence(ds, ds.variables[c].bounds, sev))
+            if c not in self._var_names:
+                continue
+            bounds = get_attributes(ds, c).get("bounds")
+            if bounds is not None:
+                res.extend(check_variable_existence(ds, bounds, sev))
         return res
 
     def check_coordinates_properties(self, ds):
         res = []
-        if (
-            not self.config
-            or not self.config.coordinates
-            or not self.config.coordinates.properties
-        ):
+        sev = self._sevs.get("coordinates.properties")
+        if sev is None:
             return res
 
-        sev = self.get_severity(self.config.coordinates.properties.severity)
 
         try:
             coords_dim = get_coordinate_variables(ds)
             coords_aux = get_auxiliary_coordinate_variables(ds)
-            all_coords = set(coords_dim + coords_aux)
+            all_coords = set(chain(coords_dim, coords_aux))
         except Exception as e:
             ctx = TestCtx(sev, "Coordinates Discovery")
             ctx.add_failure(f"Failed to identify coordinates: {e}")
             res.append(ctx.to_result())
             return res
 
-        for cname in all_coords:
-            if cname not in ds.variables:
-                continue
+        for cname in all_coords & self._var_names:
             var = ds.variables[cname]
 
             if var.dtype.kind in ["S", "U", "O"]:
                 continue
 
             res.extend(
-                check_variable_type(ds, cname, allowed_types=["f", "i"], severity=sev)
+                check_variable_type(ds, cname, allowed_types=_NUMERIC_KINDS, severity=sev)
             )
 
             if hasattr(var, "compress") or "bnds" in cname or "bounds" in cname:
@@ -895,15 +1382,10 @@ class Cmip6ProjectCheck(WCRPBaseCheck):
     def check_coordinates_time_squareness(self, ds):
         res = []
 
-        if (
-            not self.config
-            or not self.config.coordinates
-            or not self.config.coordinates.time
-            or not self.config.coordinates.time.squareness
-        ):
+        rule = self._rules.get("coordinates.time.squareness")
+        if not rule:
             return res
 
-        rule = self.config.coordinates.time.squareness
         sev = self.get_severity(rule.severity)
 
         res.extend(
@@ -921,17 +1403,14 @@ class Cmip6ProjectCheck(WCRPBaseCheck):
 
     def check_consistency_drs_from_config(self, ds):
         res = []
-        if not self.config or not self.config.drs:
-            return res
-
-        if self.config.drs.attributes_vs_directory:
-            sev = self.get_severity(self.config.drs.attributes_vs_directory.severity)
+        sev = self._sevs.get("drs.attributes_vs_directory")
+        if sev is not None:
             res.extend(
                 check_attributes_match_directory_structure(ds, sev, self.project_name)
             )
 
-        if self.config.drs.filename_vs_directory:
-            sev = self.get_severity(self.config.drs.filename_vs_directory.severity)
+        sev = self._sevs.get("drs.filename_vs_directory")
+        if sev is not None:
             res.extend(
                 check_filename_matches_directory_structure(ds, sev, self.project_name)
             )
@@ -939,74 +1418,38 @@ class Cmip6ProjectCheck(WCRPBaseCheck):
         return res
 
     def check_consistency_filename(self, ds):
-        res = []
-        if (
-            self.config
-            and self.config.consistency_checks
-            and self.config.consistency_checks.filename_vs_attributes
-        ):
-            sev = self.get_severity(
-                self.config.consistency_checks.filename_vs_attributes.severity
-            )
-            res.extend(check_filename_vs_global_attrs(ds, sev))
-        return res
+        sev = self._sevs.get("consistency_checks.filename_vs_attributes")
+        if sev is None:
+            return []
+        return check_filename_vs_global_attrs(ds, sev)
 
     def check_frequency_consistency(self, ds):
-        res = []
-        if (
-            self.config
-            and self.config.consistency_checks
-            and self.config.consistency_checks.freq_tableid
-        ):
-            sev = self.get_severity(
-                self.config.consistency_checks.freq_tableid.severity
-            )
-            res.extend(
-                check_frequency_table_id_consistency(
-                    ds, self.config.frequency_table_id_mapping or {}, sev
-                )
-            )
-        return res
+        sev = self._sevs.get("consistency_checks.freq_tableid")
+        if sev is None:
+            return []
+        return check_frequency_table_id_consistency(
+            ds, self.config.frequency_table_id_mapping or {}, sev
+        )
 
     def check_experiment_consistency(self, ds):
-        res = []
-        if (
-            self.config
-            and self.config.consistency_checks
-            and self.config.consistency_checks.experiment_details
-        ):
-            sev = self.get_severity(
-                self.config.consistency_checks.experiment_details.severity
-            )
-            res.extend(check_experiment_consistency(ds, sev, self.project_name))
-        return res
+        sev = self._sevs.get("consistency_checks.experiment_details")
+        if sev is None:
+            return []
+        return check_experiment_consistency(ds, sev, self.project_name)
 
     def check_variantlabel_consistency(self, ds):
-        res = []
-        if (
-            self.config
-            and self.config.consistency_checks
-            and self.config.consistency_checks.variant_label
-        ):
-            sev = self.get_severity(
-                self.config.consistency_checks.variant_label.severity
-            )
-            res.extend(check_variant_label_consistency(ds, sev))
-        return res
+        sev = self._sevs.get("consistency_checks.variant_label")
+        if sev is None:
+            return []
+        return check_variant_label_consistency(ds, sev)
 
     def check_consistency_institution_source(self, ds):
         res = []
-        if not self.config or not self.config.consistency_checks:
-            return res
-        if self.config.consistency_checks.institution_details:
-            sev = self.get_severity(
-                self.config.consistency_checks.institution_details.severity
-            )
+        sev = self._sevs.get("consistency_checks.institution_details")
+        if sev is not None:
             res.extend(check_institution_consistency(ds, sev, self.project_name))
-        if self.config.consistency_checks.source_details:
-            sev = self.get_severity(
-                self.config.consistency_checks.source_details.severity
-            )
+        sev = self._sevs.get("consistency_checks.source_details")
+        if sev is not None:
             res.extend(check_source_consistency(ds, sev, self.project_name))
         return res
 
@@ -1047,7 +1490,7 @@ class Cmip6ProjectCheck(WCRPBaseCheck):
             coords_to_check = ["i", "j"]
 
         for coord_name in coords_to_check:
-            if coord_name not in ds.variables:
+            if coord_name not in self._var_names:
                 continue
 
             expected = get_cmor_coordinate_info(coord_name)
@@ -1098,7 +1541,7 @@ class Cmip6ProjectCheck(WCRPBaseCheck):
                 ctx = TestCtx(BaseCheck.LOW, f"[CMOR] {coord_name}.long_name")
                 if actual is None:
                     ctx.add_failure(f"Missing long_name. Expected '{expected['long_name']}'.")
-                elif str(actual).strip().lower() != expected["long_name"].lower():
+                elif str(actual).strip().casefold() != expected["long_name_lc"]:
                     ctx.add_failure(f"Expected '{expected['long_name']}', got '{actual}'.")
                 else:
                     ctx.add_pass()
@@ -1112,133 +1555,16 @@ class Cmip6ProjectCheck(WCRPBaseCheck):
 
     def check_Horizontal_Regular_Coords(self, ds):
         """All checks for regular grid coordinates: lat, lon, lat_bnds, lon_bnds."""
-        res = []
-
         grid_type, detected, detection_res = self._detect_grid_type(ds, BaseCheck.HIGH)
-        res.extend(detection_res)
 
         if grid_type != "regular":
-            return res
-
-        # LAT checks
-        if detected.get("lat"):
-            run, sev = self._should_run_check("check_lat_exists", ds)
-            if run: res.extend(check_lat_exists(ds, sev))
-            run, sev = self._should_run_check("check_lat_type", ds)
-            if run: res.extend(check_lat_type(ds, sev))
-            run, sev = self._should_run_check("check_lat_shape", ds)
-            if run: res.extend(check_lat_shape(ds, sev))
-            run, sev = self._should_run_check("check_lat_no_nan_inf", ds)
-            if run: res.extend(check_lat_no_nan_inf(ds, sev))
-            run, sev = self._should_run_check("check_lat_value_range", ds)
-            if run: res.extend(check_lat_value_range(ds, sev))
-            run, sev = self._should_run_check("check_lat_within_bounds", ds)
-            if run: res.extend(check_lat_values_within_bounds(ds, sev))
-            run, sev = self._should_run_check("check_lat_data_within_actual_range", ds)
-            if run: res.extend(check_lat_data_within_actual_range(ds, sev))
-            # Lat attributes
-            run, sev = self._should_run_check("check_lat_axis_type", ds)
-            if run: res.extend(check_lat_axis_type(ds, sev))
-            run, sev = self._should_run_check("check_lat_axis_utf8", ds)
-            if run: res.extend(check_lat_axis_utf8(ds, sev))
-            run, sev = self._should_run_check("check_lat_axis_value", ds)
-            if run: res.extend(check_lat_axis_value(ds, sev))
-            run, sev = self._should_run_check("check_lat_units_type", ds)
-            if run: res.extend(check_lat_units_type(ds, sev))
-            run, sev = self._should_run_check("check_lat_units_utf8", ds)
-            if run: res.extend(check_lat_units_utf8(ds, sev))
-            run, sev = self._should_run_check("check_lat_long_name_exists", ds)
-            if run: res.extend(check_lat_long_name_exists(ds, sev))
-            run, sev = self._should_run_check("check_lat_long_name_type", ds)
-            if run: res.extend(check_lat_long_name_type(ds, sev))
-            run, sev = self._should_run_check("check_lat_long_name_utf8", ds)
-            if run: res.extend(check_lat_long_name_utf8(ds, sev))
-            run, sev = self._should_run_check("check_lat_long_name_value", ds)
-            if run: res.extend(check_lat_long_name_value(ds, sev))
-            run, sev = self._should_run_check("check_lat_bounds_exists", ds)
-            if run: res.extend(check_lat_bounds_exists(ds, sev))
-            run, sev = self._should_run_check("check_lat_bounds_type", ds)
-            if run: res.extend(check_lat_bounds_type(ds, sev))
-            run, sev = self._should_run_check("check_lat_bounds_utf8", ds)
-            if run: res.extend(check_lat_bounds_utf8(ds, sev))
-
-        # LON checks
-        if detected.get("lon"):
-            run, sev = self._should_run_check("check_lon_exists", ds)
-            if run: res.extend(check_lon_exists(ds, sev))
-            run, sev = self._should_run_check("check_lon_type", ds)
-            if run: res.extend(check_lon_type(ds, sev))
-            run, sev = self._should_run_check("check_lon_shape", ds)
-            if run: res.extend(check_lon_shape(ds, sev))
-            run, sev = self._should_run_check("check_lon_no_nan_inf", ds)
-            if run: res.extend(check_lon_no_nan_inf(ds, sev))
-            run, sev = self._should_run_check("check_lon_value_range", ds)
-            if run: res.extend(check_lon_value_range(ds, sev))
-            run, sev = self._should_run_check("check_lon_within_bounds", ds)
-            if run: res.extend(check_lon_values_within_bounds(ds, sev))
-            run, sev = self._should_run_check("check_lon_data_within_actual_range", ds)
-            if run: res.extend(check_lon_data_within_actual_range(ds, sev))
-            # Lon attributes
-            run, sev = self._should_run_check("check_lon_axis_type", ds)
-            if run: res.extend(check_lon_axis_type(ds, sev))
-            run, sev = self._should_run_check("check_lon_axis_utf8", ds)
-            if run: res.extend(check_lon_axis_utf8(ds, sev))
-            run, sev = self._should_run_check("check_lon_axis_value", ds)
-            if run: res.extend(check_lon_axis_value(ds, sev))
-            run, sev = self._should_run_check("check_lon_units_type", ds)
-            if run: res.extend(check_lon_units_type(ds, sev))
-            run, sev = self._should_run_check("check_lon_units_utf8", ds)
-            if run: res.extend(check_lon_units_utf8(ds, sev))
-            run, sev = self._should_run_check("check_lon_long_name_exists", ds)
-            if run: res.extend(check_lon_long_name_exists(ds, sev))
-            run, sev = self._should_run_check("check_lon_long_name_type", ds)
-            if run: res.extend(check_lon_long_name_type(ds, sev))
-            run, sev = self._should_run_check("check_lon_long_name_utf8", ds)
-            if run: res.extend(check_lon_long_name_utf8(ds, sev))
-            run, sev = self._should_run_check("check_lon_long_name_value", ds)
-            if run: res.extend(check_lon_long_name_value(ds, sev))
-            run, sev = self._should_run_check("check_lon_bounds_exists", ds)
-            if run: res.extend(check_lon_bounds_exists(ds, sev))
-            run, sev = self._should_run_check("check_lon_bounds_type", ds)
-            if run: res.extend(check_lon_bounds_type(ds, sev))
-            run, sev = self._should_run_check("check_lon_bounds_utf8", ds)
-            if run: res.extend(check_lon_bounds_utf8(ds, sev))
-
-        # LAT_BNDS checks
-        if detected.get("lat_bnds"):
-            run, sev = self._should_run_check("check_lat_bnds_exists", ds)
-            if run: res.extend(check_lat_bnds_exists(ds, sev))
-            run, sev = self._should_run_check("check_lat_bnds_type", ds)
-            if run: res.extend(check_lat_bnds_type(ds, sev))
-            run, sev = self._should_run_check("check_lat_bnds_shape", ds)
-            if run: res.extend(check_lat_bnds_shape(ds, sev))
-            run, sev = self._should_run_check("check_lat_bnds_no_nan_inf", ds)
-            if run: res.extend(check_lat_bnds_no_nan_inf(ds, sev))
-            run, sev = self._should_run_check("check_lat_bnds_value_range", ds)
-            if run: res.extend(check_lat_bnds_value_range(ds, sev))
-            run, sev = self._should_run_check("check_lat_bnds_monotonicity", ds)
-            if run: res.extend(check_lat_bnds_monotonicity(ds, sev))
-            run, sev = self._should_run_check("check_lat_bnds_contiguity", ds)
-            if run: res.extend(check_lat_bnds_contiguity(ds, sev))
-
-        # LON_BNDS checks
-        if detected.get("lon_bnds"):
-            run, sev = self._should_run_check("check_lon_bnds_exists", ds)
-            if run: res.extend(check_lon_bnds_exists(ds, sev))
-            run, sev = self._should_run_check("check_lon_bnds_type", ds)
-            if run: res.extend(check_lon_bnds_type(ds, sev))
-            run, sev = self._should_run_check("check_lon_bnds_shape", ds)
-            if run: res.extend(check_lon_bnds_shape(ds, sev))
-            run, sev = self._should_run_check("check_lon_bnds_no_nan_inf", ds)
-            if run: res.extend(check_lon_bnds_no_nan_inf(ds, sev))
-            run, sev = self._should_run_check("check_lon_bnds_value_range", ds)
-            if run: res.extend(check_lon_bnds_value_range(ds, sev))
-            run, sev = self._should_run_check("check_lon_bnds_monotonicity", ds)
-            if run: res.extend(check_lon_bnds_monotonicity(ds, sev))
-            run, sev = self._should_run_check("check_lon_bnds_contiguity", ds)
-            if run: res.extend(check_lon_bnds_contiguity(ds, sev))
+            return detection_res
 
-        return res
+        return list(chain(detection_res, chain.from_iterable(
+            self._iter_coord_checks(ds, var_name, checks)
+            for var_name, checks in self._active_coord_checks(_REGULAR_COORD_CHECKS, grid_type)
+            if detected.get(var_name)
+        )))
 
     # =========================================================================
     # COORDINATE CHECKS - HORIZONTAL CURVILINEAR (i, j, vertices)
@@ -1246,143 +1572,16 @@ class Cmip6ProjectCheck(WCRPBaseCheck):
 
     def check_Horizontal_Curvilinear_Coords(self, ds):
         """All checks for curvilinear grid coordinates: i, j, vertices_latitude, vertices_longitude."""
-        res = []
-
         grid_type, detected, detection_res = self._detect_grid_type(ds, BaseCheck.HIGH)
-        res.extend(detection_res)
 
         if grid_type != "curvilinear":
-            return res
-
-        # I checks
-        if detected.get("i"):
-            run, sev = self._should_run_check("check_i_exists", ds)
-            if run: res.extend(check_i_exists(ds, sev))
-            run, sev = self._should_run_check("check_i_type", ds)
-            if run: res.extend(check_i_type(ds, sev))
-            run, sev = self._should_run_check("check_i_shape", ds)
-            if run: res.extend(check_i_shape(ds, sev))
-            run, sev = self._should_run_check("check_i_no_nan_inf", ds)
-            if run: res.extend(check_i_no_nan_inf(ds, sev))
-            run, sev = self._should_run_check("check_i_strictly_positive", ds)
-            if run: res.extend(check_i_strictly_positive(ds, sev))
-            # I attributes
-            run, sev = self._should_run_check("check_i_units_exists", ds)
-            if run: res.extend(check_i_units_exists(ds, sev))
-            run, sev = self._should_run_check("check_i_units_type", ds)
-            if run: res.extend(check_i_units_type(ds, sev))
-            run, sev = self._should_run_check("check_i_units_utf8", ds)
-            if run: res.extend(check_i_units_utf8(ds, sev))
-            run, sev = self._should_run_check("check_i_units_value", ds)
-            if run: res.extend(check_i_units_value(ds, sev))
-            run, sev = self._should_run_check("check_i_long_name_exists", ds)
-            if run: res.extend(check_i_long_name_exists(ds, sev))
-            run, sev = self._should_run_check("check_i_long_name_type", ds)
-            if run: res.extend(check_i_long_name_type(ds, sev))
-            run, sev = self._should_run_check("check_i_long_name_utf8", ds)
-            if run: res.extend(check_i_long_name_utf8(ds, sev))
-            run, sev = self._should_run_check("check_i_long_name_value", ds)
-            if run: res.extend(check_i_long_name_value(ds, sev))
-
-        # J checks
-        if detected.get("j"):
-            run, sev = self._should_run_check("check_j_exists", ds)
-            if run: res.extend(check_j_exists(ds, sev))
-            run, sev = self._should_run_check("check_j_type", ds)
-            if run: res.extend(check_j_type(ds, sev))
-            run, sev = self._should_run_check("check_j_shape", ds)
-            if run: res.extend(check_j_shape(ds, sev))
-            run, sev = self._should_run_check("check_j_no_nan_inf", ds)
-            if run: res.extend(check_j_no_nan_inf(ds, sev))
-            run, sev = self._should_run_check("check_j_strictly_positive", ds)
-            if run: res.extend(check_j_strictly_positive(ds, sev))
-            # J attributes
-            run, sev = self._should_run_check("check_j_units_exists", ds)
-            if run: res.extend(check_j_units_exists(ds, sev))
-            run, sev = self._should_run_check("check_j_units_type", ds)
-            if run: res.extend(check_j_units_type(ds, sev))
-            run, sev = self._should_run_check("check_j_units_utf8", ds)
-            if run: res.extend(check_j_units_utf8(ds, sev))
-            run, sev = self._should_run_check("check_j_units_value", ds)
-            if run: res.extend(check_j_units_value(ds, sev))
-            run, sev = self._should_run_check("check_j_long_name_exists", ds)
-            if run: res.extend(check_j_long_name_exists(ds, sev))
-            run, sev = self._should_run_check("check_j_long_name_type", ds)
-            if run: res.extend(check_j_long_name_type(ds, sev))
-            run, sev = self._should_run_check("check_j_long_name_utf8", ds)
-            if run: res.extend(check_j_long_name_utf8(ds, sev))
-            run, sev = self._should_run_check("check_j_long_name_value", ds)
-            if run: res.extend(check_j_long_name_value(ds, sev))
-
-        # VERTICES_LATITUDE checks
-        if detected.get("vertices_latitude"):
-            run, sev = self._should_run_check("check_vertices_latitude_exists", ds)
-            if run: res.extend(check_vertices_latitude_exists(ds, sev))
-            run, sev = self._should_run_check("check_vertices_latitude_type", ds)
-            if run: res.extend(check_vertices_latitude_type(ds, sev))
-            run, sev = self._should_run_check("check_vertices_latitude_shape", ds)
-            if run: res.extend(check_vertices_latitude_shape(ds, sev))
-            run, sev = self._should_run_check("check_vertices_latitude_no_nan_inf", ds)
-            if run: res.extend(check_vertices_latitude_no_nan_inf(ds, sev))
-            run, sev = self._should_run_check("check_vertices_latitude_value_range", ds)
-            if run: res.extend(check_vertices_latitude_value_range(ds, sev))
-            run, sev = self._should_run_check("check_vertices_latitude_missing_value", ds)
-            if run: res.extend(check_vertices_latitude_missing_value(ds, sev))
-            run, sev = self._should_run_check("check_vertices_latitude_fill_value", ds)
-            if run: res.extend(check_vertices_latitude_fill_value(ds, sev))
-            # Vertices_latitude attributes
-            run, sev = self._should_run_check("check_vertices_latitude_units_exists", ds)
-            if run: res.extend(check_vertices_latitude_units_exists(ds, sev))
-            run, sev = self._should_run_check("check_vertices_latitude_units_type", ds)
-            if run: res.extend(check_vertices_latitude_units_type(ds, sev))
-            run, sev = self._should_run_check("check_vertices_latitude_units_utf8", ds)
-            if run: res.extend(check_vertices_latitude_units_utf8(ds, sev))
-            run, sev = self._should_run_check("check_vertices_latitude_units_value", ds)
-            if run: res.extend(check_vertices_latitude_units_value(ds, sev))
-            run, sev = self._should_run_check("check_vertices_latitude_missing_value_exists", ds)
-            if run: res.extend(check_vertices_latitude_missing_value_exists(ds, sev))
-            run, sev = self._should_run_check("check_vertices_latitude_missing_value_type", ds)
-            if run: res.extend(check_vertices_latitude_missing_value_type(ds, sev))
-            run, sev = self._should_run_check("check_vertices_latitude_fillvalue_exists", ds)
-            if run: res.extend(check_vertices_latitude_fillvalue_exists(ds, sev))
-            run, sev = self._should_run_check("check_vertices_latitude_fillvalue_type", ds)
-            if run: res.extend(check_vertices_latitude_fillvalue_type(ds, sev))
-
-        # VERTICES_LONGITUDE checks
-        if detected.get("vertices_longitude"):
-            run, sev = self._should_run_check("check_vertices_longitude_exists", ds)
-            if run: res.extend(check_vertices_longitude_exists(ds, sev))
-            run, sev = self._should_run_check("check_vertices_longitude_type", ds)
-            if run: res.extend(check_vertices_longitude_type(ds, sev))
-            run, sev = self._should_run_check("check_vertices_longitude_shape", ds)
-            if run: res.extend(check_vertices_longitude_shape(ds, sev))
-            run, sev = self._should_run_check("check_vertices_longitude_no_nan_inf", ds)
-            if run: res.extend(check_vertices_longitude_no_nan_inf(ds, sev))
-            run, sev = self._should_run_check("check_vertices_longitude_value_range", ds)
-            if run: res.extend(check_vertices_longitude_value_range(ds, sev))
-            run, sev = self._should_run_check("check_vertices_longitude_missing_value", ds)
-            if run: res.extend(check_vertices_longitude_missing_value(ds, sev))
-            run, sev = self._should_run_check("check_vertices_longitude_fill_value", ds)
-            if run: res.extend(check_vertices_longitude_fill_value(ds, sev))
-            # Vertices_longitude attributes
-            run, sev = self._should_run_check("check_vertices_longitude_units_exists", ds)
-            if run: res.extend(check_vertices_longitude_units_exists(ds, sev))
-            run, sev = self._should_run_check("check_vertices_longitude_units_type", ds)
-            if run: res.extend(check_vertices_longitude_units_type(ds, sev))
-            run, sev = self._should_run_check("check_vertices_longitude_units_utf8", ds)
-            if run: res.extend(check_vertices_longitude_units_utf8(ds, sev))
-            run, sev = self._should_run_check("check_vertices_longitude_units_value", ds)
-            if run: res.extend(check_vertices_longitude_units_value(ds, sev))
-            run, sev = self._should_run_check("check_vertices_longitude_missing_value_exists", ds)
-            if run: res.extend(check_vertices_longitude_missing_value_exists(ds, sev))
-            run, sev = self._should_run_check("check_vertices_longitude_missing_value_type", ds)
-            if run: res.extend(check_vertices_longitude_missing_value_type(ds, sev))
-            run, sev = self._should_run_check("check_vertices_longitude_fillvalue_exists", ds)
-            if run: res.extend(check_vertices_longitude_fillvalue_exists(ds, sev))
-            run, sev = self._should_run_check("check_vertices_longitude_fillvalue_type", ds)
-            if run: res.extend(check_vertices_longitude_fillvalue_type(ds, sev))
+            return detection_res
 
-        return res
+        return list(chain(detection_res, chain.from_iterable(
+            self._iter_coord_checks(ds, var_name, checks)
+            for var_name, checks in self._active_coord_checks(_CURVILINEAR_COORD_CHECKS, grid_type)
+            if detected.get(var_name)
+        )))
 
     # =========================================================================
     # COORDINATE CHECKS - VERTICAL (height)
@@ -1390,51 +1589,10 @@ class Cmip6ProjectCheck(WCRPBaseCheck):
 
     def check_Vertical_Coords(self, ds):
         """All checks for vertical coordinates: height."""
-        res = []
-
-        _, detected, detection_res = self._detect_grid_type(ds, BaseCheck.HIGH)
-        res.extend(detection_res)
-
-        if not detected.get("height"):
-            return res
-
-        # HEIGHT checks
-        run, sev = self._should_run_check("check_height_exists", ds)
-        if run: res.extend(check_height_exists(ds, sev))
-        run, sev = self._should_run_check("check_height_type", ds)
-        if run: res.extend(check_height_type(ds, sev))
-        run, sev = self._should_run_check("check_height_strictly_positive", ds)
-        if run: res.extend(check_height_strictly_positive(ds, sev))
-        # Height attributes
-        run, sev = self._should_run_check("check_height_axis_exists", ds)
-        if run: res.extend(check_height_axis_exists(ds, sev))
-        run, sev = self._should_run_check("check_height_axis_type", ds)
-        if run: res.extend(check_height_axis_type(ds, sev))
-        run, sev = self._should_run_check("check_height_axis_utf8", ds)
-        if run: res.extend(check_height_axis_utf8(ds, sev))
-        run, sev = self._should_run_check("check_height_axis_value", ds)
-        if run: res.extend(check_height_axis_value(ds, sev))
-        run, sev = self._should_run_check("check_height_standard_name_type", ds)
-        if run: res.extend(check_height_standard_name_type(ds, sev))
-        run, sev = self._should_run_check("check_height_standard_name_utf8", ds)
-        if run: res.extend(check_height_standard_name_utf8(ds, sev))
-        run, sev = self._should_run_check("check_height_standard_name_value", ds)
-        if run: res.extend(check_height_standard_name_value(ds, sev))
-        run, sev = self._should_run_check("check_height_long_name_exists", ds)
-        if run: res.extend(check_height_long_name_exists(ds, sev))
-        run, sev = self._should_run_check("check_height_long_name_type", ds)
-        if run: res.extend(check_height_long_name_type(ds, sev))
-        run, sev = self._should_run_check("check_height_long_name_utf8", ds)
-        if run: res.extend(check_height_long_name_utf8(ds, sev))
-        run, sev = self._should_run_check("check_height_long_name_value", ds)
-        if run: res.extend(check_height_long_name_value(ds, sev))
-        run, sev = self._should_run_check("check_height_units_type", ds)
-        if run: res.extend(check_height_units_type(ds, sev))
-        run, sev = self._should_run_check("check_height_units_utf8", ds)
-        if run: res.extend(check_height_units_utf8(ds, sev))
-        run, sev = self._should_run_check("check_height_positive_type", ds)
-        if run: res.extend(check_height_positive_type(ds, sev))
-        run, sev = self._should_run_check("check_height_positive_utf8", ds)
-        if run: res.extend(check_height_positive_utf8(ds, sev))
+        grid_type, detected, detection_res = self._detect_grid_type(ds, BaseCheck.HIGH)
 
-        return res
+        return list(chain(detection_res, chain.from_iterable(
+            self._iter_coord_checks(ds, var_name, checks)
+            for var_name, checks in self._active_coord_checks(_VERTICAL_COORD_CHECKS, grid_type)
+            if detected.get(var_name)
+        )))
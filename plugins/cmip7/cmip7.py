@@ -7,20 +7,24 @@ from __future__ import annotations
 
 import os
 import re
-from typing import Dict, Optional, List, Literal, Any, Tuple
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Optional, List, Literal, Any, Mapping, Tuple
 
-import toml
 from netCDF4 import Dataset
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, Field, PrivateAttr, model_validator
 
 from compliance_checker.base import BaseCheck, TestCtx
-from plugins.wcrp_base import WCRPBaseCheck
-from checks.attribute_checks.check_attribute_suite import check_attribute_suite
+from plugins.wcrp_base import SEVERITY_MAP, WCRPBaseCheck, load_config_toml
+from checks.attribute_checks.check_attribute_suite import (
+    check_attribute_suite,
+    check_attribute_suite_batch,
+)
 from checks.variable_checks.check_variable_existence import check_variable_existence
 from checks.time_checks.check_time_calendar import check_calendar_cmip7
 from checks.variable_checks.check_variable_type import check_variable_type
 from checks.dimension_checks.check_dimension_existence import check_dimension_existence
-from checks.dimension_checks.check_dimension_positive import check_dimension_positive
+from checks.dimension_checks.check_dimension_triad import check_dimension_triad
 from checks.dimension_checks.check_dimension_size import (
     check_dimension_size_is_equals_to,
 )
@@ -51,6 +55,7 @@ from checks.format_checks.check_format import check_format
 from checks.time_checks.check_time_bounds import check_time_bounds
 from checks.time_checks.check_time_range_vs_filename import check_time_range_vs_filename
 from checks.time_checks.check_time_squareness import check_time_squareness
+from checks.utils import fuzzy_match_dim
 
 # --- CF Checker helpers ---
 try:
@@ -75,6 +80,33 @@ try:
 except Exception:
     find_terms_in_data_descriptor = None
 
+# Variable Registry fields needed by the variable checks
+_VR_TERM_FIELDS = (
+    "cf_standard_name",
+    "cf_units",
+    "dimensions",
+    "cell_methods",
+    "cell_measures",
+    "description",
+    "long_name",
+)
+
+
+@lru_cache(maxsize=4096)
+def _find_branded_variable(branded: str):
+    """
+    Look up a branded variable in the Variable Registry. Results are cached
+    per process, since the same branded variable recurs across many files;
+    failed queries raise and are not cached.
+    """
+    terms = find_terms_in_data_descriptor(
+        expression=branded,
+        data_descriptor_id="known_branded_variable",
+        only_id=True,
+        selected_term_fields=list(_VR_TERM_FIELDS),
+    )
+    return terms[0] if terms else None
+
 
 # =============================================================================
 # Pydantic models
@@ -180,6 +212,31 @@ class CoordinatesSection(BaseModel):
     time: Optional[TimeSection] = None
 
 
+# Config nodes consulted by the Cmip7ProjectCheck check methods, by dotted path
+_CHECK_RULE_PATHS = (
+    "file.format",
+    "file.compression",
+    "drs.filename",
+    "drs.directory",
+    "drs.consistency",
+    "variable.existence",
+    "variable.type",
+    "variable.dimensions",
+    "variable.attributes",
+    "variable.shape_bounds",
+    "variable.bnds_vertices",
+    "variable.time_checks",
+    "coordinates.auxiliary",
+    "coordinates.bounds",
+    "coordinates.properties",
+    "coordinates.time.squareness",
+    "consistency_checks.filename_vs_attributes",
+    "consistency_checks.experiment_details",
+    "consistency_checks.institution_details",
+    "consistency_checks.source_details",
+)
+
+
 class CMIP7Config(BaseModel):
     project_name: str
     project_version: str
@@ -191,11 +248,83 @@ class CMIP7Config(BaseModel):
     coordinates: Optional[CoordinatesSection] = None
     consistency_checks: Optional[ConsistencyChecks] = None
 
+    _attribute_suite_args: Tuple[Mapping[str, Any], ...] = PrivateAttr(default=())
+    _enabled_rules: Mapping[str, Any] = PrivateAttr(default_factory=dict)
+    _enabled_severities: Mapping[str, int] = PrivateAttr(default_factory=dict)
+
+    @model_validator(mode="after")
+    def _resolve_attribute_rules(self):
+        # Resolve the check_attribute_suite arguments of every rule once
+        rules = [(None, k, r) for k, r in self.global_attributes.items()]
+        for v, attrs in (self.variable_attributes or {}).items():
+            rules.extend((v, k, r) for k, r in attrs.items())
+        self._attribute_suite_args = tuple(
+            MappingProxyType(
+                {
+                    "attribute_name": k,
+                    "attribute_nc_name": r.attribute_name,
+                    "severity": SEVERITY_MAP[r.severity],
+                    "value_type": r.value_type,
+                    "is_required": r.is_required,
+                    "constraint": r.constraint,
+                    "cv_collection": r.cv_source_collection,
+                    "cv_collection_key": r.cv_source_collection_key,
+                    "var_name": v,
+                }
+            )
+            for v, k, r in rules
+        )
+        return self
+
+    @model_validator(mode="after")
+    def _resolve_enabled_rules(self):
+        # Walk each check's config path once; a missing node disables the check
+        enabled = {}
+        for path in _CHECK_RULE_PATHS:
+            node = self
+            for part in path.split("."):
+                node = getattr(node, part)
+                if not node:
+                    break
+            else:
+                enabled[path] = node
+        self._enabled_rules = MappingProxyType(enabled)
+        self._enabled_severities = MappingProxyType(
+            {
+                path: SEVERITY_MAP[node.severity]
+                for path, node in enabled.items()
+                if node.severity is not None
+            }
+        )
+        return self
+
+    @property
+    def attribute_suite_args(self) -> Tuple[Mapping[str, Any], ...]:
+        """check_attribute_suite keyword arguments for all global and variable attribute rules."""
+        return self._attribute_suite_args
+
+    @property
+    def enabled_rules(self) -> Mapping[str, Any]:
+        """Config node of every enabled check, keyed by its dotted path."""
+        return self._enabled_rules
+
+    @property
+    def enabled_severities(self) -> Mapping[str, int]:
+        """BaseCheck severity of every enabled check that has one, keyed by its dotted path."""
+        return self._enabled_severities
+
 
 # =============================================================================
 # CMIP7 Project Checker Implementation
 # =============================================================================
 
+# dtype kinds accepted by check_variable_type
+_FLOAT_KINDS = ("f",)
+_NUMERIC_KINDS = ("f", "i")
+
+# Expected sizes of the bounds and vertices dimensions
+_BOUNDS_DIM_SIZES = {"bnds": 2, "axis_nbounds": 2, "vertices": 4, "nv4": 4}
+
 
 class Cmip7ProjectCheck(WCRPBaseCheck):
     _cc_spec = "wcrp_cmip7"
@@ -207,6 +336,10 @@ class Cmip7ProjectCheck(WCRPBaseCheck):
         super().__init__(options)
         self.project_name = "cmip7"
         self.config: Optional[CMIP7Config] = None
+        self._rules: Mapping[str, Any] = {}
+        self._sevs: Mapping[str, int] = {}
+        self._var_names: frozenset = frozenset()
+        self._dim_names: frozenset = frozenset()
         self._geo_var_cache = None
         self._vr_expected_cache = None
         self._vr_expected_dims_cache = None
@@ -227,16 +360,22 @@ class Cmip7ProjectCheck(WCRPBaseCheck):
         self._geo_var_cache = None
         self._vr_expected_cache = None
         self._vr_expected_dims_cache = None
+        # Variable and dimension names, read once per dataset
+        self._var_names = frozenset(ds.variables)
+        self._dim_names = frozenset(ds.dimensions)
 
     def _load_project_config(self):
         if not os.path.exists(self.project_config_path):
             raise RuntimeError(f"Config not found: {self.project_config_path}")
-        with open(self.project_config_path, "r", encoding="utf-8") as f:
-            self.config = CMIP7Config(**toml.load(f))
+        self.config = load_config_toml(
+            self.project_config_path, CMIP7Config.model_validate
+        )
+        self._rules = self.config.enabled_rules
+        self._sevs = self.config.enabled_severities
 
     # --- Helpers ---
     def _get_geo_var(self, ds, severity) -> Tuple[Optional[str], List[Any]]:
-        if self._geo_var_cache and self._geo_var_cache in ds.variables:
+        if self._geo_var_cache and self._geo_var_cache in self._var_names:
             return self._geo_var_cache, []
         results = []
         try:
@@ -280,26 +419,8 @@ class Cmip7ProjectCheck(WCRPBaseCheck):
             results.append(ctx.to_result())
             return None, None, results
 
-        fields_to_get = [
-            "cf_standard_name",
-            "cf_units",
-            "dimensions",
-            "cell_methods",
-            "cell_measures",
-            "description",
-            "long_name",
-        ]
-
-        expected = None
         try:
-            terms = find_terms_in_data_descriptor(
-                expression=str(branded),
-                data_descriptor_id="known_branded_variable",
-                only_id=True,
-                selected_term_fields=fields_to_get,
-            )
-            if terms:
-                expected = terms[0]
+            expected = _find_branded_variable(str(branded))
         except Exception as e:
             ctx = TestCtx(severity, "Variable Registry")
             ctx.add_failure(f"Error querying ESGVOC (find_terms) for '{branded}': {e}")
@@ -323,55 +444,35 @@ class Cmip7ProjectCheck(WCRPBaseCheck):
 
         return expected, expected_dims, results
 
-    @staticmethod
-    def _fuzzy_match_dim(expected, actuals):
-        if expected in actuals:
-            return expected
-        for a in actuals:
-            if a in expected or expected in a:
-                return a
-        return None
-
     # --- File Checks ---
     def check_File_Format(self, ds):
-        if not self.config or not self.config.file or not self.config.file.format:
+        r = self._rules.get("file.format")
+        if not r:
             return []
-        r = self.config.file.format
         return check_format(
-            ds, r.expected_format, r.expected_data_model, self.get_severity(r.severity)
+            ds, r.expected_format, r.expected_data_model, self._sevs["file.format"]
         )
 
     def check_File_Compression(self, ds):
-        if not self.config or not self.config.file or not self.config.file.compression:
+        r = self._rules.get("file.compression")
+        if not r:
             return []
-        r = self.config.file.compression
         return check_compression(
             ds,
             None,
             r.expected_complevel,
             r.expected_shuffle,
-            self.get_severity(r.severity),
+            self._sevs["file.compression"],
         )
 
     def check_Drs_Vocabulary(self, ds):
         res = []
-        if self.config and self.config.drs:
-            if self.config.drs.filename:
-                res.extend(
-                    check_drs_filename(
-                        ds,
-                        self.get_severity(self.config.drs.filename.severity),
-                        self.project_name,
-                    )
-                )
-            if self.config.drs.directory:
-                res.extend(
-                    check_drs_directory(
-                        ds,
-                        self.get_severity(self.config.drs.directory.severity),
-                        self.project_name,
-                    )
-                )
+        sev = self._sevs.get("drs.filename")
+        if sev is not None:
+            res.extend(check_drs_filename(ds, sev, self.project_name))
+        sev = self._sevs.get("drs.directory")
+        if sev is not None:
+            res.extend(check_drs_directory(ds, sev, self.project_name))
         return res
 
     # --- Attribute Checks ---
@@ -380,53 +481,19 @@ class Cmip7ProjectCheck(WCRPBaseCheck):
         if not self.config:
             return res
 
-        for k, r in self.config.global_attributes.items():
-            res.extend(
-                check_attribute_suite(
-                    ds=ds,
-                    attribute_name=k,
-                    attribute_nc_name=r.attribute_name,
-                    severity=self.get_severity(r.severity),
-                    value_type=r.value_type,
-                    is_required=r.is_required,
-                    constraint=r.constraint,
-                    cv_collection=r.cv_source_collection,
-                    cv_collection_key=r.cv_source_collection_key,
-                    var_name=None,
-                    project_name=self.project_name,
-                )
+        res.extend(
+            check_attribute_suite_batch(
+                ds, self.config.attribute_suite_args, project_name=self.project_name
             )
-
-        if self.config.variable_attributes:
-            for v, attrs in self.config.variable_attributes.items():
-                for k, r in attrs.items():
-                    res.extend(
-                        check_attribute_suite(
-                            ds=ds,
-                            attribute_name=k,
-                            attribute_nc_name=r.attribute_name,
-                            severity=self.get_severity(r.severity),
-                            value_type=r.value_type,
-                            is_required=r.is_required,
-                            constraint=r.constraint,
-                            cv_collection=r.cv_source_collection,
-                            cv_collection_key=r.cv_source_collection_key,
-                            var_name=v,
-                            project_name=self.project_name,
-                        )
-                    )
+        )
         return res
 
     # --- Variable Checks ---
     def check_variable_existence(self, ds):
         res = []
-        if (
-            not self.config
-            or not self.config.variable
-            or not self.config.variable.existence
-        ):
+        sev = self._sevs.get("variable.existence")
+        if sev is None:
             return res
-        sev = self.get_severity(self.config.variable.existence.severity)
         geo, r = self._get_geo_var(ds, sev)
         res.extend(r)
         if geo:
@@ -435,13 +502,13 @@ class Cmip7ProjectCheck(WCRPBaseCheck):
 
     def check_variable_type(self, ds):
         res = []
-        if not self.config or not self.config.variable or not self.config.variable.type:
+        sev = self._sevs.get("variable.type")
+        if sev is None:
             return res
-        sev = self.get_severity(self.config.variable.type.severity)
         geo, r = self._get_geo_var(ds, sev)
         res.extend(r)
         if geo:
-            res.extend(check_variable_type(ds, geo, allowed_types=["f"], severity=sev))
+            res.extend(check_variable_type(ds, geo, allowed_types=_FLOAT_KINDS, severity=sev))
         return res
 
     def check_variable_dimensions(self, ds):
@@ -450,14 +517,10 @@ class Cmip7ProjectCheck(WCRPBaseCheck):
         Checks existence of dimensions and compares with Variable Registry.
         """
         res = []
-        if (
-            not self.config
-            or not self.config.variable
-            or not self.config.variable.dimensions
-        ):
+        sev = self._sevs.get("variable.dimensions")
+        if sev is None:
             return res
 
-        sev = self.get_severity(self.config.variable.dimensions.severity)
         geo, r = self._get_geo_var(ds, sev)
         res.extend(r)
         if not geo:
@@ -466,9 +529,7 @@ class Cmip7ProjectCheck(WCRPBaseCheck):
         # 1. Checks on actual dimensions
         act = list(ds.variables[geo].dimensions)
         for d in act:
-            res.extend(check_dimension_existence(ds, d, sev))
-            res.extend(check_dimension_positive(ds, d, sev))
-            res.extend(check_variable_existence(ds, d, sev))
+            res.extend(check_dimension_triad(ds, d, sev))
 
         # 2. Comparison with Variable Registry (VR)
         exp, exp_dims, vr_r = self._get_expected_from_registry(ds, sev)
@@ -489,13 +550,15 @@ class Cmip7ProjectCheck(WCRPBaseCheck):
             res.append(ctx_len.to_result())
 
             # 3. Fuzzy Match of names
+            act_names = frozenset(act)
+            has_height = "height" in self._var_names
             for ed in exp_dims:
                 eds = str(ed)
-                if eds in {"bnds", "axis_nbounds", "vertices", "nv4"}:
+                if eds in _BOUNDS_DIM_SIZES:
                     continue
-                if self._fuzzy_match_dim(eds, act):
+                if fuzzy_match_dim(eds, act, act_names):
                     continue
-                if eds.lower().startswith("height") and "height" in ds.variables:
+                if has_height and eds.lower().startswith("height"):
                     continue
 
                 res.extend(check_dimension_existence(ds, eds, sev))
@@ -504,17 +567,10 @@ class Cmip7ProjectCheck(WCRPBaseCheck):
 
     def check_variable_attributes(self, ds):
         res = []
-        if (
-            not self.config
-            or not self.config.variable
-            or not self.config.variable.attributes
-        ):
+        rule = self._rules.get("variable.attributes")
+        if not rule:
             return res
-        d_sev = (
-            self.get_severity(self.config.variable.attributes.severity)
-            if self.config.variable.attributes.severity
-            else BaseCheck.HIGH
-        )
+        d_sev = self._sevs.get("variable.attributes", BaseCheck.HIGH)
         geo, r = self._get_geo_var(ds, d_sev)
         res.extend(r)
         if not geo:
@@ -533,7 +589,7 @@ class Cmip7ProjectCheck(WCRPBaseCheck):
             "long_name": ("long_name", "long_name"),
         }
 
-        for k, item in self.config.variable.attributes.items.items():
+        for k, item in rule.items.items():
             sev = self.get_severity(item.severity) if item else d_sev
             if k in mapping:
                 vr_f, nc_a = mapping[k]
@@ -558,8 +614,8 @@ class Cmip7ProjectCheck(WCRPBaseCheck):
 
     def check_variable_shape_bounds(self, ds):
         res = []
-        if self.config and self.config.variable and self.config.variable.shape_bounds:
-            sev = self.get_severity(self.config.variable.shape_bounds.severity)
+        sev = self._sevs.get("variable.shape_bounds")
+        if sev is not None:
             geo, r = self._get_geo_var(ds, sev)
             if geo:
                 res.extend(check_bounds_value_consistency(ds, geo, sev))
@@ -567,18 +623,18 @@ class Cmip7ProjectCheck(WCRPBaseCheck):
 
     def check_variable_bnds_vertices(self, ds):
         res = []
-        if self.config and self.config.variable and self.config.variable.bnds_vertices:
-            sev = self.get_severity(self.config.variable.bnds_vertices.severity)
-            for d, s in [("bnds", 2), ("axis_nbounds", 2), ("vertices", 4), ("nv4", 4)]:
-                if d in ds.dimensions:
+        sev = self._sevs.get("variable.bnds_vertices")
+        if sev is not None:
+            for d, s in _BOUNDS_DIM_SIZES.items():
+                if d in self._dim_names:
                     res.extend(check_dimension_size_is_equals_to(ds, d, s, sev))
         return res
 
     def check_variable_time_checks(self, ds):
         res = []
-        if self.config and self.config.variable and self.config.variable.time_checks:
-            sev = self.get_severity(self.config.variable.time_checks.severity)
-            if "time" in ds.variables:
+        sev = self._sevs.get("variable.time_checks")
+        if sev is not None:
+            if "time" in self._var_names:
                 res.extend(check_time_range_vs_filename(ds, sev))
                 res.extend(check_time_bounds(ds, sev))
         return res
@@ -586,13 +642,9 @@ class Cmip7ProjectCheck(WCRPBaseCheck):
     # --- Coordinates Checks ---
     def check_coordinates_auxiliary(self, ds):
         res = []
-        if (
-            not self.config
-            or not self.config.coordinates
-            or not self.config.coordinates.auxiliary
-        ):
+        sev = self._sevs.get("coordinates.auxiliary")
+        if sev is None:
             return res
-        sev = self.get_severity(self.config.coordinates.auxiliary.severity)
         geo, r = self._get_geo_var(ds, sev)
         res.extend(r)
         if geo:
@@ -605,13 +657,9 @@ class Cmip7ProjectCheck(WCRPBaseCheck):
 
     def check_coordinates_bounds(self, ds):
         res = []
-        if (
-            not self.config
-            or not self.config.coordinates
-            or not self.config.coordinates.bounds
-        ):
+        sev = self._sevs.get("coordinates.bounds")
+        if sev is None:
             return res
-        sev = self.get_severity(self.config.coordinates.bounds.severity)
         geo, r = self._get_geo_var(ds, sev)
         if not geo:
             return res
@@ -625,21 +673,16 @@ class Cmip7ProjectCheck(WCRPBaseCheck):
         except (AttributeError, KeyError):
             pass
         for c in cand:
-            if c in ds.variables and hasattr(ds.variables[c], "bounds"):
+            if c in self._var_names and hasattr(ds.variables[c], "bounds"):
                 res.extend(check_variable_existence(ds, ds.variables[c].bounds, sev))
         return res
 
     def check_coordinates_properties(self, ds):
         res = []
-        if (
-            not self.config
-            or not self.config.coordinates
-            or not self.config.coordinates.properties
-        ):
+        sev = self._sevs.get("coordinates.properties")
+        if sev is None:
             return res
 
-        sev = self.get_severity(self.config.coordinates.properties.severity)
-
         try:
             coords_dim = get_coordinate_variables(ds)
             coords_aux = get_auxiliary_coordinate_variables(ds)
@@ -651,7 +694,7 @@ class Cmip7ProjectCheck(WCRPBaseCheck):
             return res
 
         for cname in all_coords:
-            if cname not in ds.variables:
+            if cname not in self._var_names:
                 continue
             var = ds.variables[cname]
 
@@ -659,7 +702,7 @@ class Cmip7ProjectCheck(WCRPBaseCheck):
                 continue
 
             res.extend(
-                check_variable_type(ds, cname, allowed_types=["f", "i"], severity=sev)
+                check_variable_type(ds, cname, allowed_types=_NUMERIC_KINDS, severity=sev)
             )
 
             if hasattr(var, "compress") or "bnds" in cname or "bounds" in cname:
@@ -681,16 +724,11 @@ class Cmip7ProjectCheck(WCRPBaseCheck):
     def check_coordinates_time_squareness(self, ds):
         res = []
 
-        if (
-            not self.config
-            or not self.config.coordinates
-            or not self.config.coordinates.time
-            or not self.config.coordinates.time.squareness
-        ):
+        rule = self._rules.get("coordinates.time.squareness")
+        if not rule:
             return res
 
-        rule = self.config.coordinates.time.squareness
-        sev = self.get_severity(rule.severity)
+        sev = self._sevs["coordinates.time.squareness"]
 
         res.extend(
             check_time_squareness(
@@ -729,8 +767,8 @@ class Cmip7ProjectCheck(WCRPBaseCheck):
     # --- Consistency Checks ---
     def check_consistency_drs(self, ds):
         res = []
-        if self.config and self.config.drs and self.config.drs.consistency:
-            sev = self.get_severity(self.config.drs.consistency.severity)
+        sev = self._sevs.get("drs.consistency")
+        if sev is not None:
             res.extend(
                 check_attributes_match_directory_structure(ds, sev, self.project_name)
             )
@@ -740,43 +778,23 @@ class Cmip7ProjectCheck(WCRPBaseCheck):
         return res
 
     def check_consistency_filename(self, ds):
-        res = []
-        if (
-            self.config
-            and self.config.consistency_checks
-            and self.config.consistency_checks.filename_vs_attributes
-        ):
-            sev = self.get_severity(
-                self.config.consistency_checks.filename_vs_attributes.severity
-            )
-            res.extend(check_filename_vs_global_attrs(ds, sev))
-        return res
+        sev = self._sevs.get("consistency_checks.filename_vs_attributes")
+        if sev is None:
+            return []
+        return check_filename_vs_global_attrs(ds, sev)
 
     def check_experiment_consistency(self, ds):
-        res = []
-        if (
-            self.config
-            and self.config.consistency_checks
-            and self.config.consistency_checks.experiment_details
-        ):
-            sev = self.get_severity(
-                self.config.consistency_checks.experiment_details.severity
-            )
-            res.extend(check_experiment_consistency(ds, sev, self.project_name))
-        return res
+        sev = self._sevs.get("consistency_checks.experiment_details")
+        if sev is None:
+            return []
+        return check_experiment_consistency(ds, sev, self.project_name)
 
     def check_consistency_institution_source(self, ds):
         res = []
-        if not self.config or not self.config.consistency_checks:
-            return res
-        if self.config.consistency_checks.institution_details:
-            sev = self.get_severity(
-                self.config.consistency_checks.institution_details.severity
-            )
+        sev = self._sevs.get("consistency_checks.institution_details")
+        if sev is not None:
             res.extend(check_institution_consistency(ds, sev, self.project_name))
-        if self.config.consistency_checks.source_details:
-            sev = self.get_severity(
-                self.config.consistency_checks.source_details.severity
-            )
+        sev = self._sevs.get("consistency_checks.source_details")
+        if sev is not None:
             res.extend(check_source_consistency(ds, sev, self.project_name))
         return res
@@ -13,8 +13,6 @@
 # --- Standard library imports ---
 import os
 
-import toml
-
 from checks.attribute_checks.check_attribute_cv import (
     check_required_global_attributes_existence_cv,
     check_required_global_attributes_value_cv,
@@ -63,7 +61,7 @@ from checks.variable_checks.check_data_types import (
 )
 
 # --- Import of checks and utils ---
-from plugins.wcrp_base import WCRPBaseCheck
+from plugins.wcrp_base import WCRPBaseCheck, load_toml
 
 # --- Esgvoc universe import ---
 try:
@@ -115,8 +113,9 @@ class CordexCmip6ProjectCheck(WCRPBaseCheck):
         mapping_filepath = os.path.join(base_dir, "mapping_variables.toml")
 
         try:
-            with open(mapping_filepath) as f:
-                self.variable_mapping = toml.load(f).get("mapping_variables", {})
+            self.variable_mapping = load_toml(mapping_filepath).get(
+                "mapping_variables", {}
+            )
 
         except FileNotFoundError:
             print(f"Mapping file '{mapping_filepath}' not found.")
@@ -166,11 +165,10 @@ class CordexCmip6ProjectCheck(WCRPBaseCheck):
         [FILE002] Checks if the file is in the expected format according to the CORDEX-CMIP6 Archive Specifications.
         """
         results = []
-        if "format_checks" not in self.config:
+        config = self.config.get("format_checks")
+        if config is None:
             return results
 
-        config = self.config.get("format_checks", {})
-
         if "check_format" in config:
             check_config = config["check_format"]
             results.extend(
@@ -189,11 +187,10 @@ class CordexCmip6ProjectCheck(WCRPBaseCheck):
         [FILE003] Checks if the data compression is as expected according to the CORDEX-CMIP6 Archive Specifications.
         """
         results = []
-        if "format_checks" not in self.config:
+        config = self.config.get("format_checks")
+        if config is None:
             return results
 
-        config = self.config.get("format_checks", {})
-
         if "check_compression" in config:
             check_config = config["check_compression"]
             results.extend(
@@ -213,11 +210,10 @@ class CordexCmip6ProjectCheck(WCRPBaseCheck):
         [VAR011] Checks if the coordinate and variable data types are as expected according to the CORDEX-CMIP6 Archive Specifications.
         """
         results = []
-        if "variable_checks" not in self.config:
+        config = self.config.get("variable_checks")
+        if config is None:
             return results
 
-        config = self.config.get("variable_checks", {})
-
         if "check_coord_data_types" in config:
             check_config = config["check_coord_data_types"]
             results.extend(
@@ -246,11 +242,10 @@ class CordexCmip6ProjectCheck(WCRPBaseCheck):
         [CDXT001] Checks if the chunking with respect to the time dimension is in accordance with the CORDEX-CMIP6 Archive Specifications.
         """
         results = []
-        if "time_checks" not in self.config:
+        config = self.config.get("time_checks")
+        if config is None:
             return results
 
-        config = self.config.get("time_checks", {})
-
         if "check_time_chunking_cordex" in config:
             check_config = config["check_time_chunking_cordex"]
             results.extend(
@@ -267,11 +262,10 @@ class CordexCmip6ProjectCheck(WCRPBaseCheck):
         [CDXT002] Checks if the time range is as expected according to the CORDEX-CMIP6 Archive Specifications.
         """
         results = []
-        if "time_checks" not in self.config:
+        config = self.config.get("time_checks")
+        if config is None:
             return results
 
-        config = self.config.get("time_checks", {})
-
         if "check_time_range_cordex" in config:
             check_config = config["check_time_range_cordex"]
             results.extend(
@@ -288,11 +282,10 @@ class CordexCmip6ProjectCheck(WCRPBaseCheck):
         [CDXT003] Checks if the calendar is as expected according to the CORDEX-CMIP6 Archive Specifications.
         """
         results = []
-        if "time_checks" not in self.config:
+        config = self.config.get("time_checks")
+        if config is None:
             return results
 
-        config = self.config.get("time_checks", {})
-
         if "check_calendar_cordex" in config:
             check_config = config["check_calendar_cordex"]
             results.extend(
@@ -309,11 +302,10 @@ class CordexCmip6ProjectCheck(WCRPBaseCheck):
         [CDXT004] Checks if the time units are as expected according to the CORDEX-CMIP6 Archive Specifications.
         """
         results = []
-        if "time_checks" not in self.config:
+        config = self.config.get("time_checks")
+        if config is None:
             return results
 
-        config = self.config.get("time_checks", {})
-
         if "check_time_units_cordex" in config:
             check_config = config["check_time_units_cordex"]
             results.extend(
@@ -330,11 +322,10 @@ class CordexCmip6ProjectCheck(WCRPBaseCheck):
         [CDXA001] Checks compliance of certain CORDEX-CMIP6 global attributes with the CORDEX-CMIP6 Archive Specifications.
         """
         results = []
-        if "attribute_checks" not in self.config:
+        config = self.config.get("attribute_checks")
+        if config is None:
             return results
 
-        config = self.config.get("attribute_checks", {})
-
         if "check_grid_mapping" in config:
             check_config = config["check_grid_mapping"]
             results.extend(
@@ -414,11 +405,10 @@ class CordexCmip6ProjectCheck(WCRPBaseCheck):
         [CDXV001] Checks existence of latitude and longitude bounds as recommended in the CORDEX-CMIP6 Archive Specifications.
         """
         results = []
-        if "variable_checks" not in self.config:
+        config = self.config.get("variable_checks")
+        if config is None:
             return results
 
-        config = self.config.get("variable_checks", {})
-
         if "check_lat_lon_bounds" in config:
             check_config = config["check_lat_lon_bounds"]
             results.extend(
@@ -435,11 +425,10 @@ class CordexCmip6ProjectCheck(WCRPBaseCheck):
         [CDXV002] Checks existence of rlat/rlon or x/y bounds as recommended in the CORDEX-CMIP6 Archive Specifications.
         """
         results = []
-        if "variable_checks" not in self.config:
+        config = self.config.get("variable_checks")
+        if config is None:
             return results
 
-        config = self.config.get("variable_checks", {})
-
         if "check_horizontal_axes_bounds" in config:
             check_config = config["check_horizontal_axes_bounds"]
             results.extend(
@@ -456,11 +445,10 @@ class CordexCmip6ProjectCheck(WCRPBaseCheck):
         [CDXV003] Checks if longitude values are within the range required by the CORDEX-CMIP6 Archive Specifications.
         """
         results = []
-        if "variable_checks" not in self.config:
+        config = self.config.get("variable_checks")
+        if config is None:
             return results
 
-        config = self.config.get("variable_checks", {})
-
         if "check_lon_value_range" in config:
             check_config = config["check_lon_value_range"]
             results.extend(
@@ -477,10 +465,9 @@ class CordexCmip6ProjectCheck(WCRPBaseCheck):
         [FILE001] DRS filename and directory path checks against CV pattern using ESGVOC.
         """
         results = []
-        if "drs_checks" not in self.config:
+        config = self.config.get("drs_checks")
+        if config is None:
             return results
-
-        config = self.config["drs_checks"]
         severity = self.get_severity(config.get("severity"))
 
         # Call filename CV check
@@ -500,10 +487,9 @@ class CordexCmip6ProjectCheck(WCRPBaseCheck):
         [FILE001] DRS filename and directory path checks against CV pattern using <project>_CV.json.
         """
         results = []
-        if "drs_checks_cv" not in self.config:
+        config = self.config.get("drs_checks_cv")
+        if config is None:
             return results
-
-        config = self.config["drs_checks_cv"]
         severity = self.get_severity(config.get("severity"))
         drs_elements_hard_checks = config.get("drs_element_hard_checks", [])
         project_name = config.get("project_id", self.project_name)
@@ -570,11 +556,10 @@ class CordexCmip6ProjectCheck(WCRPBaseCheck):
     def check_global_attributes_cv(self, ds):
         """[ATTR001/004] Checks existence and value of required global attributes against CORDEX-CMIP6_CV.json."""
         results = []
-        if "required_global_attributes_checks_cv" not in self.config:
+        config = self.config.get("required_global_attributes_checks_cv")
+        if config is None:
             return results
 
-        config = self.config.get("required_global_attributes_checks_cv", {})
-
         severity = self.get_severity(config.get("severity"))
         global_attrs_hard_checks = config.get("global_attrs_hard_checks", [])
 
@@ -600,11 +585,10 @@ class CordexCmip6ProjectCheck(WCRPBaseCheck):
         [PATH001/002] Checks consistency of DRS directory structure with filename and global attributes.
         """
         results = []
-        if "consistency_checks" not in self.config:
+        config = self.config.get("consistency_checks")
+        if config is None:
             return results
 
-        config = self.config["consistency_checks"]
-
         if "drs" in config:
             severity = self.get_severity(config["drs"].get("severity"))
             project_id = self.project_name
@@ -640,11 +624,10 @@ class CordexCmip6ProjectCheck(WCRPBaseCheck):
         [ATTR005] Checks consistency of filename and global attributes.
         """
         results = []
-        if "consistency_checks" not in self.config:
+        config = self.config.get("consistency_checks")
+        if config is None:
             return results
 
-        config = self.config.get("consistency_checks", {})
-
         if "filename_vs_attributes" in config:
             check_config = config["filename_vs_attributes"]
             results.extend(
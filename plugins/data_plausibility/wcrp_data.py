@@ -10,10 +10,13 @@ the core `wcrp_cmip6` and `wcrp_cmip7` plugins.
 # =============================================================================
 from netCDF4 import Dataset
 import os
-import toml
+try:
+    import tomllib
+except ImportError:  # Python < 3.11
+    import tomli as tomllib
 from compliance_checker.base import BaseCheck, Result, TestCtx
 from plugins.wcrp_base import WCRPBaseCheck
-from checks.data_plausibility_checks.check_nan_inf import check_nan_inf
+from checks.data_plausibility_checks.check_nan_inf import check_nan_and_inf, check_nan_inf
 from checks.data_plausibility_checks.check_fill_missing import check_fillvalues_timeseries
 from checks.data_plausibility_checks.check_constant import check_constants
 from checks.data_plausibility_checks.detect_physically_impossible_outlier import check_outliers
@@ -59,8 +62,8 @@ class DatapluginProjectCheck(WCRPBaseCheck):
             self.config = {}
             return
         try:
-            with open(self.project_config_path, 'r', encoding="utf-8") as f:
-                self.config = toml.load(f)
+            with open(self.project_config_path, 'rb') as f:
+                self.config = tomllib.load(f)
         except Exception as e:
             self.config = {}
             print(f"Error parsing TOML configuration from {self.project_config_path}: {e}")
@@ -77,8 +80,8 @@ class DatapluginProjectCheck(WCRPBaseCheck):
 
         
         try:
-            with open(mapping_filepath, 'r') as f:
-                self.variable_mapping = toml.load(f).get('mapping_variables', {})
+            with open(mapping_filepath, 'rb') as f:
+                self.variable_mapping = tomllib.load(f).get('mapping_variables', {})
                 
         except FileNotFoundError:
             print(f"Mapping file '{mapping_filepath}' not found.")
@@ -103,33 +106,57 @@ class DatapluginProjectCheck(WCRPBaseCheck):
             return results
 
         config = self.config["data_plausibility_checks"]
+        if not any(
+            isinstance(c, dict) and c.get("enabled", False) for c in config.values()
+        ):
+            return results
+
         variable_id = getattr(ds, "variable_id", None)
 
         # Retrieve the project name defined in TOML (default “CMIP”)
         project = self.config.get("data_plausibility_checks", {}).get("project", "CMIP")
 
 
-        # === DATA001: NaN check ===
-        if config.get("check_nan", {}).get("enabled", False):
-            ctx = check_nan_inf(
+        check_nan = config.get("check_nan", {})
+        check_inf = config.get("check_inf", {})
+        ctx_nan = ctx_inf = None
+        if (
+            check_nan.get("enabled", False)
+            and check_inf.get("enabled", False)
+            and check_nan.get("parameter", "NaN") == "NaN"
+            and check_inf.get("parameter", "Inf") == "Inf"
+        ):
+            # Both checks scan the same data: read it once for the pair
+            ctx_nan, ctx_inf = check_nan_and_inf(
                 dataset=ds,
                 variable=variable_id,
-                parameter=config["check_nan"].get("parameter", "NaN"),
-                severity=self.get_severity(config["check_nan"].get("severity"))
+                severity=self.get_severity(check_nan.get("severity")),
+                inf_severity=self.get_severity(check_inf.get("severity"))
             )
-            ctx.description = f"[DATA001] Check for NaN values in variable '{variable_id}'"
-            results.append(ctx.to_result())
+
+        # === DATA001: NaN check ===
+        if check_nan.get("enabled", False):
+            if ctx_nan is None:
+                ctx_nan = check_nan_inf(
+                    dataset=ds,
+                    variable=variable_id,
+                    parameter=check_nan.get("parameter", "NaN"),
+                    severity=self.get_severity(check_nan.get("severity"))
+                )
+            ctx_nan.description = f"[DATA001] Check for NaN values in variable '{variable_id}'"
+            results.append(ctx_nan.to_result())
 
         # === DATA002: Inf check ===
-        if config.get("check_inf", {}).get("enabled", False):
-            ctx = check_nan_inf(
-                dataset=ds,
-                variable=variable_id,
-                parameter=config["check_inf"].get("parameter", "Inf"),
-                severity=self.get_severity(config["check_inf"].get("severity"))
-            )
-            ctx.description = f"[DATA002] Check for Inf values in variable '{variable_id}'"
-            results.append(ctx.to_result())
+        if check_inf.get("enabled", False):
+            if ctx_inf is None:
+                ctx_inf = check_nan_inf(
+                    dataset=ds,
+                    variable=variable_id,
+                    parameter=check_inf.get("parameter", "Inf"),
+                    severity=self.get_severity(check_inf.get("severity"))
+                )
+            ctx_inf.description = f"[DATA002] Check for Inf values in variable '{variable_id}'"
+            results.append(ctx_inf.to_result())
 
         # === DATA003: Fill value check ===
         if config.get("check_fill", {}).get("enabled", False):
@@ -4,13 +4,18 @@ import json
 import os
 import re
 from collections import ChainMap
+from functools import lru_cache
 from hashlib import md5
 from pathlib import Path
 
+try:
+    import tomllib
+except ImportError:  # Python < 3.11
+    import tomli as tomllib
+
 import cf_xarray  # noqa
 import cftime
 import numpy as np
-import toml
 import xarray as xr
 from compliance_checker.base import BaseCheck
 from netCDF4 import Dataset
@@ -34,6 +39,59 @@ get_abs_tseconds = lambda t: abs(t.total_seconds())  # noqa
 get_abs_tseconds_vector = np.vectorize(get_abs_tseconds)
 
 
+# Severity Mapping
+SEVERITY_MAP = {
+    "HIGH": BaseCheck.HIGH,
+    "H": BaseCheck.HIGH,
+    "MEDIUM": BaseCheck.MEDIUM,
+    "M": BaseCheck.MEDIUM,
+    "LOW": BaseCheck.LOW,
+    "L": BaseCheck.LOW,
+}
+
+
+@lru_cache(maxsize=64)
+def _severity_from_str(severity_str, default_severity_str):
+    """Resolve a config severity string; the handful of spellings is cached."""
+    default_severity_const = SEVERITY_MAP.get(
+        default_severity_str.upper(), BaseCheck.MEDIUM
+    )
+    return SEVERITY_MAP.get(severity_str.upper(), default_severity_const)
+
+
+@lru_cache(maxsize=32)
+def _parse_toml(path, mtime_ns, size):
+    with open(path, "rb") as f:
+        return tomllib.load(f)
+
+
+def load_toml(path):
+    """
+    Parse a TOML file once per process. The result is cached on the file's
+    modification time and size, so an edited file is parsed again. The
+    returned dict is shared between callers and must not be modified.
+    """
+    st = os.stat(path)
+    return _parse_toml(os.path.abspath(path), st.st_mtime_ns, st.st_size)
+
+
+@lru_cache(maxsize=32)
+def _validate_toml(validate, path, mtime_ns, size):
+    return validate(_parse_toml(path, mtime_ns, size))
+
+
+def load_config_toml(path, validate):
+    """
+    Parse a TOML config with load_toml and validate it with ``validate``
+    (e.g. a pydantic model's ``model_validate``). The validated config is
+    cached like the parsed file, so checking many files against the same
+    config validates it once. The returned config is shared and must not
+    be modified.
+    """
+    st = os.stat(path)
+    return _validate_toml(validate, os.path.abspath(path), st.st_mtime_ns, st.st_size)
+
+
 class WCRPBaseCheck(BaseCheck):
     """
     Base class for WCRP project-specific compliance checks.
@@ -44,14 +102,7 @@ class WCRPBaseCheck(BaseCheck):
     supported_ds = [Dataset]
 
     # Severity Mapping
-    SEVERITY_MAP = {
-        "HIGH": BaseCheck.HIGH,
-        "H": BaseCheck.HIGH,
-        "MEDIUM": BaseCheck.MEDIUM,
-        "M": BaseCheck.MEDIUM,
-        "LOW": BaseCheck.LOW,
-        "L": BaseCheck.LOW,
-    }
+    SEVERITY_MAP = SEVERITY_MAP
 
     # cc_plugin attributes
     _cc_spec = "wcrp_base"
@@ -202,8 +253,7 @@ class WCRPBaseCheck(BaseCheck):
             self.config = {}
             return
         try:
-            with open(self.project_config_path, encoding="utf-8") as f:
-                self.config = toml.load(f)
+            self.config = load_toml(self.project_config_path)
         except Exception as e:
             self.config = {}
             print(
@@ -212,12 +262,12 @@ class WCRPBaseCheck(BaseCheck):
 
     def get_severity(self, severity_str, default_severity_str="MEDIUM"):
         """Converts a severity string (from TOML) to a BaseCheck constant."""
-        default_severity_const = self.SEVERITY_MAP.get(
-            default_severity_str.upper(), BaseCheck.MEDIUM
-        )
+        if isinstance(severity_str, int):
+            # Already resolved, e.g. an IntEnum valued as a BaseCheck constant
+            return int(severity_str)
         if severity_str is None:
-            return default_severity_const
-        return self.SEVERITY_MAP.get(str(severity_str).upper(), default_severity_const)
+            return _severity_from_str(default_severity_str, "MEDIUM")
+        return _severity_from_str(str(severity_str), default_severity_str)
 
     def _initialize_CV_info(self, tables_path):
         """Find and read CV and CMOR tables and extract basic information."""
@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+"""
+Tests for check_attribute_suite_batch in checks/attribute_checks/check_attribute_suite.py
+"""
+
+from compliance_checker.base import BaseCheck
+from compliance_checker.tests import BaseTestCase
+from tests.helpers import MockNetCDF
+
+from checks.attribute_checks.check_attribute_suite import (
+    check_attribute_suite,
+    check_attribute_suite_batch,
+)
+
+
+class TestCheckAttributeSuiteBatch(BaseTestCase):
+    """Tests for check_attribute_suite_batch."""
+
+    def _dataset(self):
+        dataset = MockNetCDF()
+        dataset.setncattr("Table_ID", "Amon")
+        dataset.createDimension("time", 2)
+        var = dataset.createVariable("tas", "f", ("time",))
+        var.setncattr("Units", "K")
+        return dataset
+
+    def test_batch_resolves_attribute_case_once_per_target(self):
+        """Test that attribute names are matched case-insensitively per file and variable."""
+        dataset = self._dataset()
+        rules = [
+            {"attribute_name": "table_id", "severity": BaseCheck.MEDIUM, "value_type": "str"},
+            {"attribute_name": "units", "severity": BaseCheck.MEDIUM, "value_type": "str", "var_name": "tas"},
+        ]
+        results = check_attribute_suite_batch(dataset, rules, project_name="cmip6")
+
+        assert len(results) == 6
+        for res in results:
+            self.assert_result_is_good(res)
+
+    def test_absent_optional_attribute(self):
+        """Test that an absent optional attribute yields no result."""
+        dataset = self._dataset()
+        rules = [
+            {"attribute_name": "comment", "severity": BaseCheck.MEDIUM, "value_type": "str", "is_required": False},
+            {"attribute_name": "comment", "severity": BaseCheck.MEDIUM, "value_type": "str", "is_required": False, "var_name": "tas"},
+        ]
+
+        assert check_attribute_suite_batch(dataset, rules, project_name="cmip6") == []
+
+    def test_absent_required_attribute(self):
+        """Test that an absent required attribute fails ATTR001 as check_attribute_suite does."""
+        dataset = self._dataset()
+        rules = [
+            {"attribute_name": "source_id", "severity": BaseCheck.HIGH, "value_type": "str"},
+            {"attribute_name": "long_name", "severity": BaseCheck.MEDIUM, "value_type": "str", "var_name": "tas"},
+        ]
+        results = check_attribute_suite_batch(dataset, rules, project_name="cmip6")
+
+        assert len(results) == 2
+        for res, rule in zip(results, rules):
+            self.assert_result_is_bad(res)
+            assert res.name.startswith("[ATTR001]")
+            expected = check_attribute_suite(dataset, project_name="cmip6", **rule)
+            assert [(r.name, r.weight, r.value, r.msgs) for r in expected] == [
+                (res.name, res.weight, res.value, res.msgs)
+            ]
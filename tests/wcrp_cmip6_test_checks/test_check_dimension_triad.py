@@ -0,0 +1,53 @@
+#!/usr/bin/env python
+"""
+Test for check_dimension_triad.py
+"""
+
+from compliance_checker.base import BaseCheck
+from compliance_checker.tests import BaseTestCase
+from tests.helpers import MockNetCDF
+
+from checks.dimension_checks.check_dimension_existence import check_dimension_existence
+from checks.dimension_checks.check_dimension_positive import check_dimension_positive
+from checks.dimension_checks.check_dimension_triad import check_dimension_triad
+from checks.variable_checks.check_variable_existence import check_variable_existence
+
+
+class TestCheckDimensionTriad(BaseTestCase):
+    """The fused check reports exactly what the three separate checks do."""
+
+    def _separate(self, ds, name):
+        return (
+            check_dimension_existence(ds, name, BaseCheck.HIGH)
+            + check_dimension_positive(ds, name, BaseCheck.HIGH)
+            + check_variable_existence(ds, name, BaseCheck.HIGH)
+        )
+
+    def _assert_same(self, fused, separate):
+        assert len(fused) == len(separate) == 3
+        for a, b in zip(fused, separate):
+            assert (a.name, a.weight, a.value, a.msgs) == (b.name, b.weight, b.value, b.msgs)
+
+    def test_dimension_with_coordinate_variable(self):
+        dataset = MockNetCDF()
+        dataset.createDimension("lat", 3)
+        dataset.createVariable("lat", "f", ("lat",))
+
+        results = check_dimension_triad(dataset, "lat", BaseCheck.HIGH)
+
+        for res in results:
+            self.assert_result_is_good(res)
+        self._assert_same(results, self._separate(dataset, "lat"))
+
+    def test_missing_and_unlimited_empty_dimensions(self):
+        dataset = MockNetCDF()
+        dataset.createDimension("time", None)
+
+        self._assert_same(
+            check_dimension_triad(dataset, "time", BaseCheck.HIGH),
+            self._separate(dataset, "time"),
+        )
+        self._assert_same(
+            check_dimension_triad(dataset, "plev", BaseCheck.HIGH),
+            self._separate(dataset, "plev"),
+        )
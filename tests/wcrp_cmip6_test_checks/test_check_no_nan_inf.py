@@ -156,3 +156,44 @@ class TestCheckNoNanInf(BaseTestCase):
         assert len(results) == 2
         for result in results:
             self.assert_result_is_good(result)
+
+    # FUSED NAN/INF CHECK
+
+    def test_check_nan_and_inf_matches_separate_checks(self):
+        """Test that the fused check reports what two check_nan_inf calls do."""
+        from checks.data_plausibility_checks.check_nan_inf import (
+            check_nan_and_inf,
+            check_nan_inf,
+        )
+
+        dataset = MockNetCDF()
+        dataset.createDimension("lat", 4)
+        lat_var = dataset.createVariable("lat", "f", ("lat",))
+        lat_var[:] = np.array([-90.0, -45.0, 45.0, 90.0])
+
+        ctx_nan, ctx_inf = check_nan_and_inf(dataset, "lat")
+        for fused, parameter in ((ctx_nan, "NaN"), (ctx_inf, "Inf")):
+            a = fused.to_result()
+            b = check_nan_inf(dataset, "lat", parameter=parameter).to_result()
+            assert (a.name, a.weight, a.value, a.msgs) == (b.name, b.weight, b.value, b.msgs)
+            self.assert_result_is_good(a)
+
+    def test_check_nan_and_inf_reports_non_numeric_data(self):
+        """Test that non-numeric data fails both checks with an error instead of raising."""
+        from checks.data_plausibility_checks.check_nan_inf import (
+            check_nan_and_inf,
+            check_nan_inf,
+        )
+
+        dataset = MockNetCDF()
+        dataset.createDimension("lat", 2)
+        lat_var = dataset.createVariable("lat", "S1", ("lat",))
+        lat_var[:] = np.array([b"a", b"b"])
+
+        ctx_nan, ctx_inf = check_nan_and_inf(dataset, "lat")
+        for fused, parameter in ((ctx_nan, "NaN"), (ctx_inf, "Inf")):
+            a = fused.to_result()
+            b = check_nan_inf(dataset, "lat", parameter=parameter).to_result()
+            assert (a.name, a.weight, a.value, a.msgs) == (b.name, b.weight, b.value, b.msgs)
+            self.assert_result_is_bad(a)
+            assert a.msgs[0].startswith(f"Error during {parameter} check:")
@@ -460,3 +460,37 @@ class TestCheckVarAttributesMissingVariable(BaseTestCase):
 
         assert len(results) == 1
         self.assert_result_is_bad(results[0])
+
+
+class TestCheckVarAttributesUtf8Batch(BaseTestCase):
+    """Tests for the batched UTF-8 validation of coordinate attributes."""
+
+    def test_validate_attrs_utf8_skips_missing_and_non_string(self):
+        """Test that only present string attributes are reported."""
+        dataset = MockNetCDF()
+        dataset.createDimension("lat", 3)
+        lat_var = dataset.createVariable("lat", "f", ("lat",))
+        lat_var.axis = "Y"
+        lat_var.units = "degrees_north"
+        lat_var.actual_range = np.array([-90.0, 90.0], dtype="f4")
+
+        from checks.coordinate_checks.check_var_attributes import validate_attrs_utf8
+        status = validate_attrs_utf8(dataset, "lat", ("axis", "units", "long_name", "actual_range"))
+
+        assert status == {"axis": True, "units": True}
+
+    def test_check_lat_units_utf8_uses_precomputed_status(self):
+        """Test that the UTF-8 check reads the precomputed status when given."""
+        dataset = MockNetCDF()
+        dataset.createDimension("lat", 3)
+        lat_var = dataset.createVariable("lat", "f", ("lat",))
+        lat_var.units = "degrees_north"
+
+        from checks.coordinate_checks.check_var_attributes import check_lat_units_utf8
+        results = check_lat_units_utf8(dataset, utf8_status={"units": False})
+
+        assert len(results) == 1
+        self.assert_result_is_bad(results[0])
+
+        results = check_lat_units_utf8(dataset, utf8_status={})
+        assert results == []
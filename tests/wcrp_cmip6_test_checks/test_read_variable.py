@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+"""
+Tests for the read_variable and get_attribute caches in checks/utils.py
+"""
+
+import numpy as np
+import pytest
+from compliance_checker.tests import BaseTestCase
+from tests.helpers import MockNetCDF
+
+from checks.utils import (
+    enable_read_cache,
+    get_attribute,
+    get_attributes,
+    read_variable,
+)
+
+
+class TestReadVariable(BaseTestCase):
+    """Tests for read_variable, get_attributes, get_attribute and enable_read_cache."""
+
+    def _dataset(self):
+        dataset = MockNetCDF()
+        dataset.createDimension("lat", 3)
+        lat_var = dataset.createVariable("lat", "f", ("lat",), fill_value=-999.0)
+        lat_var[:] = np.array([-90.0, -999.0, 90.0])
+        return dataset
+
+    def test_uncached_dataset_reads_every_time(self):
+        """Test that datasets without the cache are read on each call."""
+        dataset = self._dataset()
+
+        assert read_variable(dataset, "lat") is not read_variable(dataset, "lat")
+
+    def test_cached_dataset_decodes_once_per_mode(self):
+        """Test that the cache is shared per masking mode and matches a direct read."""
+        dataset = self._dataset()
+        enable_read_cache(dataset)
+
+        masked = read_variable(dataset, "lat")
+        assert read_variable(dataset, "lat") is masked
+        assert np.ma.is_masked(masked)
+
+        dataset.variables["lat"].set_auto_mask(False)
+        raw = read_variable(dataset, "lat")
+        assert raw is not masked
+        np.testing.assert_array_equal(raw, dataset.variables["lat"][:])
+
+    def test_cached_arrays_are_read_only(self):
+        """Test that shared cached arrays, and views into them, reject in-place writes."""
+        dataset = self._dataset()
+        enable_read_cache(dataset)
+        data = read_variable(dataset, "lat")
+
+        with pytest.raises(ValueError):
+            data[0] = 0.0
+        with pytest.raises(ValueError):
+            data.mask[0] = True
+        with pytest.raises(ValueError):
+            np.asarray(data).ravel()[0] = 0.0
+
+    def test_get_attribute_matches_getattr(self):
+        """Test that get_attribute behaves as getattr, with and without the cache."""
+        dataset = self._dataset()
+        dataset.variables["lat"].units = "degrees_north"
+
+        for _ in range(2):
+            assert get_attribute(dataset, "lat", "units") == "degrees_north"
+            assert get_attribute(dataset, "lat", "axis") is None
+            assert get_attribute(dataset, "lat", "axis", "missing") == "missing"
+            assert get_attribute(dataset, "lat", "_FillValue") == -999.0
+            enable_read_cache(dataset)
+
+    def test_get_attributes_snapshot_is_shared_once_cached(self):
+        """Test that get_attributes returns one shared snapshot per variable once cached."""
+        dataset = self._dataset()
+        dataset.variables["lat"].units = "degrees_north"
+
+        assert get_attributes(dataset, "lat") is not get_attributes(dataset, "lat")
+        enable_read_cache(dataset)
+        attrs = get_attributes(dataset, "lat")
+        assert attrs == {"_FillValue": -999.0, "units": "degrees_north"}
+        assert get_attributes(dataset, "lat") is attrs